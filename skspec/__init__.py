@@ -7,6 +7,7 @@ from skspec.core.spectra import Spectra
 from skspec.core.timespectra import TimeSpectra
 from skspec.core.anyspectra import AnyFrame
 from skspec.core.specstack import SpecStack
+from skspec.core.mmapspectra import MmapSpectra
 
 from skspec.units.abcunits import Unit
 
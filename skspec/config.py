@@ -35,6 +35,19 @@ R_MESH = MESH  #If want default mesh to be non-square
 HEADERDELIM = '\t'
 HEADERHTMLDELIM = '&nbsp;' * 8
 
+# Default memory budget of Spectra.cache_norms() (bytes)
+NORM_CACHE_BYTES = 256 * 1024**2
+
+# Dtype of Spectra data (eg 'float32' to halve memory); None keeps the
+# data's dtype and computes in float64.  Overridden by Spectra(dtype=...)
+SPECTRA_DTYPE = None
+
+# Memory per chunk of columns read by MmapSpectra (bytes)
+MMAP_CHUNK_BYTES = 64 * 1024**2
+
+# Number of converted indexes (eg. nm to ev) kept by ConversionIndex.convert()
+CONVERT_CACHE_SIZE = 32
+
 # Default specifier to Spectrum
 SPECIFIERDEF = 'values' 
 MISSING = '??' #When unit info is missing, header/plotting will refer to this
@@ -1,6 +1,9 @@
+import weakref
 from pandas import Float64Index, Index
 import numpy as np
-from skspec.units.abcunits import UnitError, Unit, ConversionUnit
+from skspec.units.abcunits import UnitError, Unit, ConversionUnit, compose
+from skspec.core.cache import LRUCache
+import skspec.config as pvconfig
 
 
 # Parsing Functions (because need access before self exists)
@@ -22,6 +25,58 @@ def _parse_conversion_unit(unit, unitdict):
    return unitdict[unit]  
 
 
+def _reduce_index(index, unit):
+   """ __reduce__ of Custom/ConversionIndex.  numpy/pandas pickling keeps
+   only values and name, dropping _unit (and _id); rebuild through the 
+   constructor with unit, restoring other attributes (name, _grid...)."""
+   attrs = dict((k, v) for k, v in index.__dict__.iteritems()
+                if k not in ('_unit', '_id'))
+   return (_rebuild_index, (index.__class__, np.asarray(index), unit, attrs))
+
+
+def _rebuild_index(cls, values, unit, attrs):
+   index = cls(values, unit=unit)
+   index.__dict__.update(attrs)
+   return index
+
+
+def _detect_grid(values, rtol=1e-9):
+   """ (start, step, n) if values are evenly spaced (to within rtol of the
+   step, eg. from np.linspace), else None."""
+   values = np.asarray(values)
+   n = len(values)
+   if n < 2 or values.ndim != 1 or values.dtype.kind not in 'iuf':
+      return None
+
+   start = float(values[0])
+   step = (float(values[-1]) - start) / (n - 1)
+   if step == 0:
+      return None
+
+   if np.all(np.abs(values - (start + step * np.arange(n))) <= rtol * abs(step)):
+      return (start, step, n)
+   return None
+
+
+def _view_grid(view, parent):
+   """ Grid of view if it is a basic slice of parent, an evenly spaced
+   index (ie shares its memory); read from its end values in O(1).  
+   None if unknown."""
+   # view.base isn't set yet when __array_finalize__ is called
+   if not getattr(parent, '_grid', None) or view.ndim != 1 or \
+      not np.may_share_memory(view, parent):
+      return None
+
+   values = view.view(np.ndarray)
+   n = len(values)
+   if n == 0:
+      return None
+   elif n == 1:
+      return (float(values[0]), parent._grid[1], 1)
+   start = float(values[0])
+   return (start, (float(values[-1]) - start) / (n - 1), n)
+
+
 # Custom Index Classes
 # --------------------
 
@@ -54,6 +109,9 @@ class CustomIndex(Float64Index):#(Index):
       obj = np.asarray(input_array).view(cls)                 
       obj._unit = _parse_unit(unit)
       return obj
+
+   def __reduce__(self):
+      return _reduce_index(self, self._unit)
    
    #def __getattr__(self, attr):
       #""" Defer attribute call to self._unit"""
@@ -100,6 +158,13 @@ class ConversionIndex(Index):
    unitdict = None 
    addnullunit = True
    _forcetype = None 
+
+   # (start, step, n) if evenly spaced, False if not, None if unknown
+   _grid = None
+
+   # (weakref to index, converted values, their grid, index values, index
+   # grid) by (id(index), inunit, outunit); see convert()
+   _convert_cache = LRUCache(maxsize=pvconfig.CONVERT_CACHE_SIZE)
    
 
    def __new__(cls, input_array, unit=None):
@@ -113,6 +178,9 @@ class ConversionIndex(Index):
       obj._unit = _parse_conversion_unit(unit, cls.unitdict)
       return obj
 
+   def __reduce__(self):
+      return _reduce_index(self, self._unit.short)
+
    # I am not really worred about other constructors yet...
    def __array_finalize__(self, obj):
       """No matter what constructor called, this will get called, so does
@@ -136,12 +204,40 @@ class ConversionIndex(Index):
       else:
          self._unit = unit
 
+      # Slices of an evenly spaced index are too; no need to re-detect
+      self._grid = _view_grid(self, obj)
+
+   @property
+   def grid(self):
+      """ (start, step, n) if values are evenly spaced, else None.  Used
+      for O(1) label to position lookups (eg. nearby).  Detected once per
+      index (O(n)); slices of an evenly spaced index get theirs in O(1)."""
+      if self._grid is None:
+         self._grid = _detect_grid(self) or False
+      return self._grid or None
+
+   def grid_positions(self, values):
+      """ Positions of the labels nearest to values (scalar or array) by
+      arithmetic on the grid.  Requires evenly spaced index (see grid).  
+      Values outside of the index are clipped to its ends."""
+      start, step, n = self.grid
+      # Ties (halfway between labels) go to the lower position
+      positions = np.ceil((np.asarray(values, dtype=float) - start) / step - 0.5)
+      return np.clip(positions, 0, n - 1).astype(int)[()]
+
    def convert(self, outunit):
       """Convert spectral values based on string outunit.  First converts
       the current unit to the canonical unit (eg, nanometers goes to meters)
       then to the outunit (eg, meters to eV).  This is done through the unit
       methods, .to_canonical() and .from_canonical() where in the case of
       spectral units, canonical refers to meters.
+
+      Units that are linear or reciprocal in the canonical unit (see
+      abcunits.compose()) are converted in a single pass.  Converted values
+      are cached (config.CONVERT_CACHE_SIZE), as is the reverse conversion,
+      so toggling units back and forth returns the original values.  Each
+      call returns a new index; the cache holds weak references to indexes,
+      and only their values.
       """
       outunit = _parse_conversion_unit(outunit, self.unitdict)
       inunit = self._unit
@@ -155,10 +251,47 @@ class ConversionIndex(Index):
          return self.__class__(self, unit = outunit.short)
 
       # Convert non-null unit to another non-null unit   
-      else: 
+      # Weak reference checks that id(self) wasn't reused by another index
+      cached = self._convert_cache.get((id(self), inunit.short, outunit.short))
+      if cached is not None and cached[0]() is self:
+         return self._converted(outunit, *cached[1:])
+
+      transform = compose(inunit, outunit)
+      if transform is None:
          canonical = inunit.to_canonical(np.array(self))
          arrayout = outunit.from_canonical(canonical)
-         return self.__class__(arrayout, unit=outunit.short)      
+      else:
+         kind, k = transform
+         if kind == 'linear':
+            arrayout = k * np.asarray(self)
+         else:
+            arrayout = k / np.asarray(self)
+      arrayout = np.asarray(arrayout, dtype=self._forcetype)
+
+      # Scaling keeps even spacing
+      grid = None
+      if transform is not None and transform[0] == 'linear' and self._grid:
+         start, step, n = self._grid
+         grid = (k * start, k * step, n)
+
+      # Copy, so the cache doesn't keep self alive through its values
+      original = np.array(self)
+      self._convert_cache.set((id(self), inunit.short, outunit.short),
+                              (weakref.ref(self), arrayout, grid, original,
+                               self._grid))
+      return self._converted(outunit, arrayout, grid, original, self._grid)
+
+   def _converted(self, outunit, values, grid, original, originalgrid):
+      """ New index in outunit viewing cached, converted values (no copy),
+      keeping name.  Caches the conversion back to self._unit on it."""
+      out = values.view(self.__class__)
+      out._unit = outunit
+      out._grid = grid
+      out.name = self.name
+      self._convert_cache.set((id(out), outunit.short, self._unit.short),
+                              (weakref.ref(out), original, originalgrid,
+                               values, grid))
+      return out
       
 
    #Email list about this distinction
@@ -1,9 +1,10 @@
 #Want C(abcspectra, metaframe)
 
-from pandas import Series, DataFrame
+from pandas import Series, DataFrame, MultiIndex
 import skspec.core.utilities as pvutils
 import skspec.config as pvconfig
-from pandas.core.indexing import _LocIndexer
+from pandas.core.common import is_bool_indexer
+from pandas.core.indexing import _LocIndexer, is_list_like
 from skspec.units.abcunits import IUnit, Unit, UnitError
 import numpy as np
 
@@ -123,6 +124,9 @@ class ABCSpectra(object):
    # Indexer
    _nearby=None
 
+   # Attributes bound to an instance (see MetaPandasObject._transfer)
+   _untransferred = ('_ix', '_iloc', '_loc', '_nearby')
+
    @property
    def nearby(self, *args, **kwargs):      	
       """ Slicers similiar to loc that allows for nearby value slicing.
@@ -166,8 +170,92 @@ class ABCSpectra(object):
          raise UnitError('Unit must be a string, IUnit type or None!')
 
 
+def _slice_conserved(series, slobj):
+   """ Positional slice of a conserved attribute (eg reference, baseline),
+   an index-aligned Series; keeps its name."""
+   return Series(series.values[slobj], index=series.index[slobj],
+                 name=series.name)
+
+
 # Nearby Indexer 
 # --------------
+class _SortedLabels(object):
+   """ Sorted view of an axis' values, for nearest-value lookups by binary
+   search (O(log n) per value) rather than a full pass over the axis.
+   Handles ascending (eg nm), descending (eg cm-1) and unsorted axes.
+   Evenly spaced axes (see ConversionIndex.grid) are looked up in O(1)
+   without sorting.
+   """
+
+   def __init__(self, labels):
+      self.labels = labels
+      values = np.asarray(labels.values)
+
+      self.grid = getattr(labels, 'grid', None)
+      if self.grid is not None:
+         self.vmin, self.vmax = sorted((values[0], values[-1]))
+         return
+
+      # Positions in labels of the sorted values (None if already sorted)
+      self.reversed = False
+      if np.all(values[1:] >= values[:-1]):
+         self.order = None
+      elif np.all(values[1:] <= values[:-1]):
+         self.order = np.arange(len(values) - 1, -1, -1)
+         self.reversed = True
+      else:
+         self.order = np.argsort(values, kind='mergesort')
+
+      if self.order is None:
+         self.sorted = values
+      else:
+         self.sorted = values[self.order]
+      self.unique = not np.any(self.sorted[1:] == self.sorted[:-1])
+      self.vmin, self.vmax = self.sorted[0], self.sorted[-1]
+
+   def positions(self, v):
+      """ Positions in labels of the values nearest to v (scalar or array).
+      Ties go to the first position, as with np.abs(values - v).argmin().
+      """
+      v = np.asarray(v)
+      vmin, vmax = self.vmin, self.vmax
+      if isinstance(vmin, np.datetime64):
+         v = v.astype(vmin.dtype)
+
+      if np.any(v < vmin):
+         raise SpecIndexError("%s is less than Index min value of %s" 
+                              % (np.min(v), vmin))
+      elif np.any(v > vmax):
+         raise SpecIndexError("%s is greater than Index max value of %s" 
+                              % (np.max(v), vmax))
+
+      if self.grid is not None:
+         return self.labels.grid_positions(v)
+
+      svals = self.sorted
+      if len(svals) == 1:
+         return np.zeros(v.shape, dtype=int)[()]
+
+      # Nearest is one of the two sorted values around v
+      right = np.clip(np.searchsorted(svals, v), 1, len(svals) - 1)
+      left = right - 1
+      dleft, dright = v - svals[left], svals[right] - v
+
+      # Of repeated values, take the one first in labels
+      if not self.unique:
+         if self.reversed:
+            right = np.searchsorted(svals, svals[right], side='right') - 1
+         else:
+            left = np.searchsorted(svals, svals[left])
+
+      if self.order is not None:
+         left, right = self.order[left], self.order[right]
+
+      out = np.where(dleft < dright, left,
+                     np.where(dright < dleft, right, np.minimum(left, right)))
+      return out[()]
+
+
 class _NearbyIndexer(_LocIndexer):
    """ Index by location, but looks for nearest values.  Warning: not all
    use cases may be handled properly; this is predominantly for range slices
@@ -188,6 +276,38 @@ class _NearbyIndexer(_LocIndexer):
       A boolean array
    """   
 
+   def __init__(self, *args, **kwargs):
+      super(_NearbyIndexer, self).__init__(*args, **kwargs)
+      self._sorted_axes = {}
+
+   def _sorted(self, axis):
+      """ _SortedLabels of axis, cached until the axis is replaced (eg. by
+      a unit conversion)."""
+      labels = self.obj._get_axis(axis)
+      sortedlabels = self._sorted_axes.get(axis)
+      if sortedlabels is None or sortedlabels.labels is not labels:
+         sortedlabels = _SortedLabels(labels)
+         self._sorted_axes[axis] = sortedlabels
+      return sortedlabels
+
+   def nearest(self, values, axis=0):
+      """ Label(s) of axis nearest to values, a scalar or array (eg. to
+      snap many slider positions or ranges to the data at once)."""
+      positions = self._sorted(axis).positions(values)
+      return self.obj._get_axis(axis).values[positions]
+
+   def _take(self, positions, axis):
+      """ Positions along axis, with conserved attributes (eg reference)
+      taken from the same rows."""
+      obj = self.obj
+      out = obj._transfer(obj._frame.take(positions, axis=axis))
+      if axis == 0:
+         cnsvdattr = getattr(obj, 'cnsvdattr', {})
+         for name, value in cnsvdattr.iteritems():
+            if value is not None:
+               setattr(out, name, _slice_conserved(value, positions))
+      return out
+
    def _getitem_axis(self, key, axis=0, validate_iterable=False):
       """ This is the only method that needs overwritten to preserve all
       _LocIndexer functionality.  Just need to change aspects where it
@@ -198,21 +318,7 @@ class _NearbyIndexer(_LocIndexer):
       """
 
       labels = self.obj._get_axis(axis)
-      values = labels.values #Necessary for subtraciton in find_nearest
-
-      def _nearest(v):
-         """ Find the neareast value in the Index (cast to array type);
-         necessary because diff (ie subtraction) is not defined on Index
-         in the way used here.
-         """
-         vmin, vmax = min(values), max(values)
-         if v < vmin:
-            raise SpecIndexError("%s is less than Index min value of %s" 
-                                 % (v, vmin))
-         elif v > vmax:
-            raise SpecIndexError("%s is greater than Index max value of %s" 
-                                 % (v, vmax))
-         return values[(np.abs(values - v)).argmin()]
+      _nearest = lambda v: self.nearest(v, axis=axis)
 
       if isinstance(key, slice):
          start, stop, step = key.start, key.stop, key.step
@@ -224,40 +330,20 @@ class _NearbyIndexer(_LocIndexer):
          self._has_valid_type(key, axis)
          out = self._get_slice_axis(key, axis=axis)
 
-      elif _is_bool_indexer(key):
+      elif is_bool_indexer(key):
          raise NotImplementedError('Bool indexing not supported by _Nearby Indexer')
 #            return self._getbool_axis(key, axis=axis)
 
-      elif _is_list_like(key):
-
-         # GH 7349
-         # possibly convert a list-like into a nested tuple
-         # but don't convert a list-like of tuples
-         # I Just chose to not support this case work
+      elif is_list_like(key):
          if isinstance(labels, MultiIndex):
             raise SpecIndexError("MultiIndex nearby slicing not supported.")
 
-         # an iterable multi-selection (eg nearby[[50, 55, 65]])
-         if not (isinstance(key, tuple) and
-                 isinstance(labels, MultiIndex)):
-
-            if hasattr(key, 'ndim') and key.ndim > 1:
-               raise ValueError('Cannot index with multidimensional key')
-
-            if validate_iterable:
-               self._has_valid_type(key, axis)
-
-            # WILL OUTPUT WRONG INDEX STUFF LIKE TIMEINDEX
-            # NEED TO FIX
-            raise NotImplementedError("See GH #107")
-            out = self._getitem_iterable(key, axis=axis)
+         if hasattr(key, 'ndim') and key.ndim > 1:
+            raise ValueError('Cannot index with multidimensional key')
 
-         # nested tuple slicing
-         if _is_nested_tuple(key, labels):
-            locs = labels.get_locs(key)
-            indexer = [ slice(None) ] * self.ndim
-            indexer[axis] = locs
-            out = self.obj.iloc[tuple(indexer)]
+         # an iterable multi-selection (eg nearby[[50, 55, 65]]) is looked
+         # up in one batch, then taken by position (keeps the index type)
+         out = self._take(self._sorted(axis).positions(key), axis)
 
       # fall thru to straight lookup
       else:
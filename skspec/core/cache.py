@@ -0,0 +1,58 @@
+""" Small least-recently-used cache, used to memoize expensive, derived data
+(eg Spectra norm representations) within a memory budget."""
+
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """ Dictionary-like store that drops the least recently used entries
+    when the total size of entries exceeds max_bytes, or the number of
+    entries exceeds maxsize.  Either limit can be None (unlimited).  Sizes
+    are passed by the caller, so any object can be stored.
+    """
+
+    def __init__(self, max_bytes=None, maxsize=None):
+        self.max_bytes = max_bytes
+        self.maxsize = maxsize
+        self.nbytes = 0
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        """ Value at key (marked as most recently used) or default """
+        try:
+            value, nbytes = self._data.pop(key)
+        except KeyError:
+            return default
+        self._data[key] = (value, nbytes)
+        return value
+
+    def set(self, key, value, nbytes=0):
+        """ Store value of size nbytes; not stored if larger than max_bytes."""
+        if key in self._data:
+            self.nbytes -= self._data.pop(key)[1]
+
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+
+        while self._data and (
+              (self.max_bytes is not None and
+               self.nbytes + nbytes > self.max_bytes) or
+              (self.maxsize is not None and len(self._data) >= self.maxsize)):
+            self.nbytes -= self._data.popitem(last=False)[1][1]
+
+        self._data[key] = (value, nbytes)
+        self.nbytes += nbytes
+
+    def clear(self):
+        self._data.clear()
+        self.nbytes = 0
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return '%s (%s entries, %s bytes)' % (self.__class__.__name__,
+                                              len(self), self.nbytes)
@@ -0,0 +1,138 @@
+""" Lazy evaluation of chained Spectra operations (see Spectra.lazy()).  For
+example:
+
+   >>> ts.lazy().sub_base().as_norm('a').nearby[400:700].area().compute()
+
+Operations are recorded and only run by compute(), which reorders them so
+that slices are taken before normalization/baseline subtraction, and these
+elementwise steps share a single copy of the sliced data.  Only this
+sub-block and the final result are allocated.
+"""
+
+import numpy as np
+from pandas import DataFrame
+
+# Operation kinds: slices (nearby, iloc) commute with elementwise steps since
+# conserved attributes (reference, baseline) are sliced along with the data.
+_SLICES = ('nearby', 'iloc')
+
+
+def _is_elementwise(op):
+   """ sub_base and as_norm with the stored reference act row by row on
+   the data; as_norm with a passed reference can't be sliced first."""
+   name, args, kwargs = op
+   if name == 'sub_base':
+      return True
+   if name == 'as_norm':
+      reference = kwargs.get('reference', args[1] if len(args) > 1 else None)
+      return reference is None
+   return False
+
+
+class _LazyIndexer(object):
+   """ Records nearby[...] or iloc[...] on a LazySpectra """
+
+   def __init__(self, lazy, name):
+      self.lazy = lazy
+      self.name = name
+
+   def __getitem__(self, key):
+      return self.lazy._add(self.name, key)
+
+
+class LazySpectra(object):
+   """ Chain of Spectra operations, evaluated by compute().  Supports
+   sub_base(), as_norm(), nearby[], iloc[], boxcar(), wavelength_slices()
+   and area(); each returns a new LazySpectra.  The source Spectra is not
+   modified.
+
+   Notes
+   -----
+   Slices are moved ahead of sub_base/as_norm (but never past boxcar,
+   wavelength_slices, area or as_norm with a new reference, which run in
+   order).  Results are the same as running the chain eagerly.
+   """
+
+   def __init__(self, spectra, ops=()):
+      self.spectra = spectra
+      self.ops = tuple(ops)
+
+   def _add(self, name, *args, **kwargs):
+      return self.__class__(self.spectra, self.ops + ((name, args, kwargs),))
+
+   # Recorded operations
+   # -------------------
+   @property
+   def nearby(self):
+      return _LazyIndexer(self, 'nearby')
+
+   @property
+   def iloc(self):
+      return _LazyIndexer(self, 'iloc')
+
+   def sub_base(self):
+      return self._add('sub_base')
+
+   def as_norm(self, unit, reference=None):
+      return self._add('as_norm', unit, reference=reference)
+
+   def boxcar(self, binwidth, axis=1):
+      return self._add('boxcar', binwidth, axis=axis)
+
+   def wavelength_slices(self, ranges, apply_fcn='mean', **applyfcn_kwds):
+      return self._add('wavelength_slices', ranges, apply_fcn=apply_fcn,
+                       **applyfcn_kwds)
+
+   def area(self, apply_fcn='simps'):
+      return self._add('area', apply_fcn=apply_fcn)
+
+   # Evaluation
+   # ----------
+   def compute(self):
+      """ Run the operations and return the result (eg Spectra)."""
+      out = self.spectra
+      slices, elementwise = [], []
+
+      for op in self.ops + (None,):
+         if op is not None and op[0] in _SLICES:
+            slices.append(op)
+         elif op is not None and _is_elementwise(op):
+            elementwise.append(op)
+         else:
+            out = self._evaluate(out, slices, elementwise)
+            slices, elementwise = [], []
+            if op is not None:
+               name, args, kwargs = op
+               out = getattr(out, name)(*args, **kwargs)
+
+      # Never return the source itself
+      if out is self.spectra:
+         out = out.deepcopy()
+      return out
+
+
+   def _evaluate(self, spectra, slices, elementwise):
+      """ Apply slices, then elementwise steps in place on one copy of the
+      sliced data."""
+      for name, args, kwargs in slices:
+         spectra = getattr(spectra, name)[args[0]]
+
+      if not elementwise:
+         return spectra
+
+      frame = spectra._frame
+      values = np.array(frame.values, dtype=spectra._float_dtype)
+      spectra = spectra._transfer(DataFrame(values, index=frame.index,
+                                            columns=frame.columns))
+
+      for name, args, kwargs in elementwise:
+         getattr(spectra, name)(*args, inplace=True, **kwargs)
+      return spectra
+
+   def __repr__(self):
+      steps = ['%s%s' % (name, args[0] if name in _SLICES else
+                         '(%s)' % ', '.join(map(repr, args)))
+               for name, args, kwargs in self.ops]
+      return '%s: %s' % (self.__class__.__name__,
+                         ' -> '.join([self.spectra.full_name] + steps))
+
@@ -0,0 +1,353 @@
+""" Out-of-core Spectra, for datasets too large for memory (eg. long
+TimeSpectra runs).  Data is stored as a raw, memory-mapped array file, with
+index, columns, units and other metadata pickled alongside (path.meta).
+Spectra are stored contiguously (column-major), so data is read and written
+by chunks of columns.
+"""
+
+import cPickle
+import logging
+logger = logging.getLogger(__name__)
+
+import numpy as np
+from pandas import DataFrame, Series
+
+import skspec.config as pvconfig
+from skspec.core.abcindex import ConversionIndex
+from skspec.core.abcspectra import SpecError, _SortedLabels
+from skspec.core.spectra import Spectrum, spec_slice, _slice_conserved
+
+META_EXT = '.meta'
+
+
+def _index_state(index, values=None):
+   """ Picklable (class, values, unit, name) of an index; pickling a
+   ConversionIndex directly loses its unit."""
+   if values is None:
+      values = np.asarray(index)
+   return (index.__class__, values, getattr(index, 'unit', None), index.name)
+
+
+def _restore_index(state):
+   cls, values, unit, name = state
+   if issubclass(cls, ConversionIndex):
+      index = cls(values, unit=unit)
+      index.name = name
+      return index
+   return cls(values, name=name)
+
+
+def _write_mmap(path, chunks):
+   """ Write an iterable of Spectra with the same index, side by side (ie
+   concatenated along columns), to path and its metadata to path.meta.
+   Metadata (units, reference...) is taken from the first chunk.  Returns
+   number of columns written.
+   """
+   template, dtype, columns = None, None, []
+   with open(path, 'wb') as f:
+      for chunk in chunks:
+         values = chunk._frame.values
+         if template is None:
+            template, dtype = chunk, values.dtype
+         elif values.shape[0] != template.shape[0]:
+            raise SpecError('Chunk has %s rows; expected %s' %
+                            (values.shape[0], template.shape[0]))
+         # Transpose is written in C order, ie column-major
+         np.asarray(values, dtype=dtype).T.tofile(f)
+         columns.append(np.asarray(chunk.columns))
+
+   if template is None:
+      raise SpecError('No data to write to %s' % path)
+
+   columns = np.concatenate(columns)
+   attrs = dict((k, v) for k, v in template.__dict__.iteritems()
+                if k != '_frame' and k not in template._untransferred)
+
+   # Conserved Series are stored like the index, so their units survive
+   series = {}
+   for attr in ('_reference', '_baseline'):
+      value = attrs.get(attr)
+      if value is not None:
+         series[attr] = (np.asarray(value), _index_state(value.index), 
+                         value.name)
+         del attrs[attr]
+
+   meta = dict(cls=template.__class__,
+               attrs=attrs,
+               series=series,
+               shape=(template.shape[0], len(columns)),
+               dtype=dtype.str,
+               index=_index_state(template.index),
+               columns=_index_state(template.columns, values=columns))
+
+   with open(path + META_EXT, 'wb') as f:
+      cPickle.dump(meta, f, protocol=cPickle.HIGHEST_PROTOCOL)
+   logger.info('Wrote %s X %s %s to %s' % (meta['shape'] +
+                                           (template.__class__.__name__, path)))
+   return len(columns)
+
+
+class _MmapIndexer(object):
+   """ iloc (by position) or nearby (by nearest value) on MmapSpectra.
+   Only the selected rows and columns are read from disk.
+   """
+
+   def __init__(self, obj, nearest=False):
+      self.obj = obj
+      self.nearest = nearest
+
+   def _positions(self, key, axis):
+      """ key as a positional slice or array along axis (0: index, 1: columns)
+      """
+      labels = self.obj.index if axis == 0 else self.obj.columns
+      n = len(labels)
+
+      if self.nearest:
+         nearest = self.obj._sorted(axis).positions
+         if isinstance(key, slice):
+            start = 0 if key.start is None else nearest(key.start)
+            stop = n if key.stop is None else nearest(key.stop) + 1
+            return slice(start, stop, key.step)
+         return nearest(key)
+
+      if isinstance(key, slice):
+         return key
+      elif np.isscalar(key):
+         return int(key) % n
+      key = np.asarray(key)
+      if key.dtype == bool:
+         return np.flatnonzero(key)
+      return key
+
+   def __getitem__(self, key):
+      if isinstance(key, tuple):
+         rowkey, colkey = key
+      else:
+         rowkey, colkey = key, slice(None)
+
+      rows = self._positions(rowkey, 0)
+      cols = self._positions(colkey, 1)
+
+      # Scalar positions return a Spectrum/value as for Spectra
+      squeeze = tuple(0 if isinstance(pos, (int, np.integer)) else slice(None)
+                      for pos in (rows, cols))
+      rows, cols = [slice(pos, pos + 1) if isinstance(pos, (int, np.integer))
+                    else pos for pos in (rows, cols)]
+
+      out = self.obj._window(rows, cols)
+      if squeeze != (slice(None), slice(None)):
+         out = out.iloc[squeeze]
+      return out
+
+
+class MmapSpectra(object):
+   """ Spectra whose data is a memory-mapped file on disk.  Selections
+   (iloc, nearby) return in-memory Spectra of only the selected data;
+   wavelength_slices(), area() and as_norm() read the data by chunks of
+   columns.
+
+   Create with Spectra.to_mmap(), MmapSpectra.from_spectra() or, for data
+   that doesn't fit in memory, MmapSpectra.from_chunks().  Open an existing
+   file with MmapSpectra(path).
+
+   Notes
+   -----
+   chunksize is the number of columns read at once; defaults to as many as
+   fit in config.MMAP_CHUNK_BYTES.
+   """
+
+   def __init__(self, path, mode='r', chunksize=None):
+      """ Open data at path (and its metadata, path.meta).  mode is 'r'
+      (read-only) or 'r+' (changes to self.values are written to disk)."""
+      with open(path + META_EXT, 'rb') as f:
+         meta = cPickle.load(f)
+
+      self.path = path
+      self.values = np.memmap(path, dtype=meta['dtype'], mode=mode,
+                              shape=meta['shape'], order='F')
+      self.index = _restore_index(meta['index'])
+      self.columns = _restore_index(meta['columns'])
+
+      # Spectra with metadata only; selections are transferred from this
+      cls = meta['cls']
+      self._template = cls.__new__(cls)
+      self._template.__dict__.update(meta['attrs'])
+      for attr, (values, state, name) in meta['series'].iteritems():
+         self._template.__dict__[attr] = Series(values, name=name,
+                                                index=_restore_index(state))
+      self._template._frame = DataFrame(index=self.index)
+      self._sorted_axes = {}
+
+      if chunksize is None:
+         colbytes = self.shape[0] * self.values.dtype.itemsize
+         chunksize = pvconfig.MMAP_CHUNK_BYTES // max(colbytes, 1)
+      self.chunksize = max(int(chunksize), 1)
+
+
+   @classmethod
+   def from_spectra(cls, spectra, path, chunksize=None):
+      """ Write in-memory spectra to path; returns MmapSpectra."""
+      _write_mmap(path, [spectra])
+      return cls(path, chunksize=chunksize)
+
+   @classmethod
+   def from_chunks(cls, path, chunks, chunksize=None):
+      """ Write an iterable of Spectra with the same index (eg. a generator
+      reading one file at a time) to path, concatenated along columns.  Only
+      one chunk is in memory at a time.  Metadata (units, reference...) are
+      taken from the first chunk."""
+      _write_mmap(path, chunks)
+      return cls(path, chunksize=chunksize)
+
+
+   # Spectra attributes
+   # ------------------
+   @property
+   def shape(self):
+      return self.values.shape
+
+   @property
+   def name(self):
+      return self._template.name
+
+   @property
+   def norm(self):
+      return self._template.norm
+
+   @property
+   def specunit(self):
+      return self._template.specunit
+
+   @property
+   def varunit(self):
+      return self._template.varunit
+
+   @property
+   def reference(self):
+      return self._template.reference
+
+   @property
+   def baseline(self):
+      return self._template.baseline
+
+   @property
+   def iloc(self):
+      return _MmapIndexer(self)
+
+   @property
+   def nearby(self):
+      return _MmapIndexer(self, nearest=True)
+
+   def _sorted(self, axis):
+      """ _SortedLabels of index (axis 0) or columns (axis 1) for nearby,
+      cached until the axis is replaced."""
+      labels = self.index if axis == 0 else self.columns
+      sortedlabels = self._sorted_axes.get(axis)
+      if sortedlabels is None or sortedlabels.labels is not labels:
+         sortedlabels = _SortedLabels(labels)
+         self._sorted_axes[axis] = sortedlabels
+      return sortedlabels
+
+
+   # Reading by windows/chunks
+   # -------------------------
+   def _window(self, rows, cols):
+      """ In-memory Spectra of positional slices or arrays rows, cols."""
+      # Slices are views of the memmap; apply first so arrays read less.
+      block = self.values
+      if isinstance(rows, slice):
+         block = block[rows]
+      if isinstance(cols, slice):
+         block = block[:, cols]
+      if not isinstance(rows, slice):
+         block = block[rows]
+      if not isinstance(cols, slice):
+         block = block[:, cols]
+
+      out = self._template._transfer(DataFrame(np.array(block),
+                                               index=self.index[rows],
+                                               columns=self.columns[cols]))
+      if not (isinstance(rows, slice) and rows == slice(None)):
+         for attr in ('_reference', '_baseline'):
+            value = getattr(out, attr)
+            if value is not None:
+               setattr(out, attr, _slice_conserved(value, rows))
+      return out
+
+   def chunks(self, rows=slice(None)):
+      """ Iterate over in-memory Spectra of self.chunksize columns (and
+      positional rows)."""
+      for start in range(0, self.shape[1], self.chunksize):
+         yield self._window(rows, slice(start, start + self.chunksize))
+
+
+   def to_spectra(self):
+      """ Read all data into memory. """
+      return self._window(slice(None), slice(None))
+
+
+   def wavelength_slices(self, ranges, apply_fcn='mean', **applyfcn_kwds):
+      """ Spectra.wavelength_slices(), reading only the rows of each range,
+      by chunks of columns.  Returns in-memory Spectrum (one range) or
+      Spectra."""
+      if isinstance(ranges, float) or isinstance(ranges, int):
+         ranges = spec_slice(self.index, ranges)
+
+      if len(ranges) == 2 and np.isscalar(ranges[0]):
+         ranges = [ranges]
+
+      dflist = []; snames = []
+      for rng in ranges:
+         if len(rng) != 2:
+            raise AttributeError("In slices function, all ranges passed in "
+               "must be len 2, aka a start and stop pair.  %s of length %s "
+               "was entered" % (rng, len(rng)))
+
+         rows = self.index.slice_indexer(rng[0], rng[1])
+         dflist.append(np.concatenate([
+            np.asarray(chunk.wavelength_slices(rng, apply_fcn=apply_fcn,
+                                               **applyfcn_kwds))
+            for chunk in self.chunks(rows)]))
+         snames.append('%s:%s' % (rng[0], rng[1]))
+
+      if len(dflist) == 1:
+         return Spectrum.from_series(self._template,
+                                     Series(dflist[0], index=self.columns))
+      return self._template._transfer(DataFrame(dflist, index=snames,
+                                                columns=self.columns))
+
+   def area(self, apply_fcn='simps'):
+      """ Spectra.area() by chunks of columns."""
+      out = self.wavelength_slices((self.index[0], self.index[-1]),
+                                   apply_fcn=apply_fcn)
+      out.specifier = 'Area (%s)' % apply_fcn
+      return out
+
+
+   def as_norm(self, unit, path, reference=None):
+      """ Spectra.as_norm(), written by chunks of columns to a new file at
+      path.  Returns MmapSpectra of the converted data."""
+      # Column reference must be read from the full dataset, not a chunk
+      if reference is not None and np.isscalar(reference):
+         if reference in self.columns:
+            col = self.columns.get_loc(reference)
+         else:
+            col = reference
+         reference = Series(np.array(self.values[:, col]), index=self.index,
+                            name=self.columns[col])
+
+      def _converted():
+         for chunk in self.chunks():
+            chunk.as_norm(unit, reference=reference, inplace=True)
+            yield chunk
+
+      _write_mmap(path, _converted())
+      return self.__class__(path, chunksize=self.chunksize)
+
+
+   def __len__(self):
+      return self.shape[0]
+
+   def __repr__(self):
+      return '%s (%s X %s) at %s' % ((self._template.__class__.__name__,) +
+                                     self.shape + (self.path,))
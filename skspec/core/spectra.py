@@ -10,7 +10,8 @@ import datetime
 import numpy as np
 from scipy import integrate
 
-from pandas import DataFrame, DatetimeIndex, Index, Series, read_csv, MultiIndex
+from pandas import DataFrame, DatetimeIndex, Index, Series, read_csv, MultiIndex, \
+                   to_datetime
 from pandas.core.common import is_bool_indexer
 from pandas.core.indexing import is_list_like, is_nested_tuple
 
@@ -18,7 +19,10 @@ from pandas.core.indexing import is_list_like, is_nested_tuple
 from skspec.core.specindex import SpecIndex
 from skspec.core.abcindex import ConversionIndex, CustomIndex
 from skspec.core.specstack import SpecStack
-from skspec.core.abcspectra import ABCSpectra, SpecError
+from skspec.core.cache import LRUCache
+from skspec.core.lazy import LazySpectra
+from skspec.core.bands import BandIntegrator
+from skspec.core.abcspectra import ABCSpectra, SpecError, _slice_conserved
 
 import skspec.core.utilities as pvutils
 import skspec.config as pvconfig
@@ -54,11 +58,73 @@ from_T={'t':lambda x: 1.0/x,
 
 
 to_T={'t':lambda x: 1.0/x,
-      '%t':lambda x: (1.0/ x) / 100.0,
+      '%t':lambda x: 100.0 / x,
       'r':lambda x: x,
       'a':lambda x: np.power(10, -x),
       'a(ln)':lambda x: np.exp(-x)}
 
+# Norms as functions of R=data/reference (see from_T), used by _convert_norm.
+# ('pow', c, p) is c * R**p and ('log', k, d) is k * ln(R) + d
+_normforms={'t':('pow', 1.0, -1),
+            '%t':('pow', 100.0, -1),
+            'r':('pow', 1.0, 1),
+            'a':('log', -1.0/np.log(10), 0.0),
+            'a(ln)':('log', -1.0, 0.0)}
+
+
+def _affine(values, scale, offset=0.0):
+   """ values * scale + offset in place, skipping identity steps."""
+   if np.any(scale != 1):
+      np.multiply(values, scale, out=values)
+   if np.any(offset != 0):
+      np.add(values, offset, out=values)
+
+
+def _convert_norm(values, sin, sout, ref=None, oldref=None):
+   """ Convert values (N X M float array) from norm sin to norm sout in
+   place, in at most a few ufunc passes (rather than to_T then from_T).
+
+   ref is the reference (length N array) relating full data to the norms,
+   required if sin or sout is None.  If oldref is passed, values are
+   referenced to oldref and are re-referenced to ref.
+   """
+   # Full data is R scaled by reference
+   def _form(norm):
+      if norm is None:
+         return ('pow', ref[:, np.newaxis], 1)
+      return _normforms[norm]
+
+   kind1, a1, b1 = _form(sin)
+   kind2, a2, b2 = _form(sout)
+
+   # R(oldref) = R(ref) * ref/oldref; fold into the input's coefficients
+   if oldref is not None:
+      ratio = (ref / oldref)[:, np.newaxis]
+      if kind1 == 'pow':
+         a1 = a1 * ratio**b1
+      else:
+         b1 = b1 + a1 * np.log(ratio)
+
+   if kind1 == 'pow':
+      if kind2 == 'pow':
+         if b1 == b2:
+            _affine(values, a2 / a1)
+         else:
+            np.divide(a1 * a2, values, out=values)
+      # ln(R) = ln(x/c)/p
+      else:
+         _affine(values, 1.0 / a1)
+         np.log(values, out=values)
+         _affine(values, a2 / b1, b2)
+   else:
+      if kind2 == 'log':
+         _affine(values, a2 / a1, b2 - b1 * a2 / a1)
+      # R**p = exp(p * (x-d)/k)
+      else:
+         _affine(values, b2 / a1, -b1 * b2 / a1)
+         np.exp(values, out=values)
+         _affine(values, a2)
+
 
 def spec_slice(spectral_array, bins):
    """ Simple method that will divide a spectral index into n evenly sliced
@@ -68,6 +134,24 @@ def spec_slice(spectral_array, bins):
    edges=np.histogram(spectral_array, bins)[1]
    return [ (edges[idx], edges[i]) for idx, i in enumerate( range(1, len(edges)))]
 
+
+def _count_iunit():
+   """ Default Spectra iunit """
+   return IUnit(short='cts', full='Counts (photons)', symbol=r'$\gamma$') # ever used?
+
+
+def _parse_datetimes(labels, fmt):
+   """ DatetimeIndex of string labels in strptime format fmt.  The whole
+   array is parsed at once (format is compiled once); falls back to
+   datetime.strptime per label for formats pandas can't parse."""
+   labels = np.asarray(labels, dtype=object)
+   try:
+      return DatetimeIndex(to_datetime(labels, format=fmt, errors='raise'))
+   except ValueError:
+      return DatetimeIndex([datetime.datetime.strptime(s, fmt)
+                            for s in labels])
+
+
 # Unit validations
 def _valid_xunit(value, dic):
    """ Validates existence of key (usually a unit type like spectral unit in a dictionary such as specunits)"""
@@ -345,6 +429,11 @@ class Spectra(ABCSpectra, MetaDataFrame):
    the current label object to generate teh next object.
    """
 
+   # Norm representations stored by as_norm(); see cache_norms()
+   _normcache = None
+   _dtype = None
+   _untransferred = ABCSpectra._untransferred + ('_normcache',)
+
    def __init__(self, *dfargs, **dfkwargs):
 
       self._strict_index = dfkwargs.pop('strict_index', SpecIndex)
@@ -356,10 +445,7 @@ class Spectra(ABCSpectra, MetaDataFrame):
       # Spectral index-related keywords
       specunit = dfkwargs.pop('specunit', None)
       varunit = dfkwargs.pop('varunit', Unit())
-      iunit = dfkwargs.pop('iunit', IUnit(short='cts',
-                                         full='Counts (photons)',
-                                         symbol=r'$\gamma$') # ever used?
-                                         )
+      iunit = dfkwargs.pop('iunit', _count_iunit())
 
       # Intensity data-related stuff
       norm = dfkwargs.pop('norm', None)
@@ -369,6 +455,13 @@ class Spectra(ABCSpectra, MetaDataFrame):
       reference = dfkwargs.pop('reference', None)
       bline = dfkwargs.pop('baseline', None)
 
+      # Dtype policy (eg float32), kept by data and results computed from it
+      dtype = dfkwargs.pop('dtype', pvconfig.SPECTRA_DTYPE)
+      if dtype is not None:
+         dtype = np.dtype(dtype)
+         dfkwargs['dtype'] = dtype
+      self._dtype = dtype
+
       # Logging __init__() in @logclass can't access self.name
       logger.info('Initializing %s' %  '%s:(name = %s)' %
                   (self.__class__.__name__, self.name))
@@ -547,9 +640,10 @@ class Spectra(ABCSpectra, MetaDataFrame):
 
    @property
    def reference(self):
-      """ This is stored as a Series unless user has set it otherwise."""
+      """ This is stored as a Series unless user has set it otherwise.
+      Returns a copy, since reference is shared by transferred Spectra."""
       if self._reference is not None:
-         return Spectrum(self._reference.values, self._reference.index)
+         return Spectrum(self._reference.values.copy(), self._reference.index)
 
    @reference.setter
    def reference(self, reference, force_series=True):
@@ -567,7 +661,7 @@ class Spectra(ABCSpectra, MetaDataFrame):
          if self._normtype == None:
             reference=self._reference_valid(reference, force_series=force_series)
 
-            self._reference=reference
+            self._reference=self._as_dtype(reference)
 
          # Let _set_normtype() do lifting.  Basically convert to full and back to current normtype.
          else:
@@ -705,6 +799,9 @@ class Spectra(ABCSpectra, MetaDataFrame):
       -----_
       See description of 'df_wavelength_slices' in utilities.py for more information.
       For easy plotting, plot the transpose of the returned timespectra.
+
+      'mean', 'sum', 'trapz' and 'simps' are computed for all ranges and
+      columns at once from cumulative sums along the index (see bands.py).
       """
 
       dflist=[]; snames=[]
@@ -713,9 +810,13 @@ class Spectra(ABCSpectra, MetaDataFrame):
          ranges=spec_slice(self.index, ranges)
 
       # If single range is passed in, want to make sure it can still be iterated over...
-      if len(ranges)==2:
+      if len(ranges)==2 and np.isscalar(ranges[0]):
          ranges=[ranges]
 
+      out = self._band_slices(ranges, apply_fcn)
+      if out is not None:
+         return out
+
       for rng in ranges:
          if len(rng)!=2:
             raise AttributeError("In slices function, all ranges passed in must be len 2, aka a start and stop \
@@ -768,8 +869,42 @@ class Spectra(ABCSpectra, MetaDataFrame):
 
       # Out is a series (e.g. Area)
       if len(dflist) == 1:
-         return dflist[0]
-      return self._transfer(DataFrame(dflist, index=snames))
+         return self._as_dtype(dflist[0])
+      return self._transfer(self._as_dtype(DataFrame(dflist, index=snames)))
+
+
+   def _band_slices(self, ranges, apply_fcn):
+      """ wavelength_slices() through BandIntegrator, or None if apply_fcn
+      isn't one of its methods.  mean and sum of data with NaNs are left to
+      pandas, which skips them."""
+      if not isinstance(apply_fcn, basestring):
+         return None
+      method = apply_fcn.lower()
+      values = self._frame.values
+      if method not in BandIntegrator.methods or values.dtype.kind not in 'fiu':
+         return None
+      if method in ('mean', 'sum') and np.isnan(values).any():
+         return None
+
+      for rng in ranges:
+         if len(rng)!=2:
+            raise AttributeError("In slices function, all ranges passed in must be len 2, aka a start and stop \
+                pair.  %s of length %s was entered" % (rng, len(rng)))
+
+      slices = [self.index.slice_indexer(rng[0], rng[1]) for rng in ranges]
+      if any(not isinstance(slc, slice) or slc.step not in (None, 1)
+             for slc in slices):
+         return None
+
+      bands = BandIntegrator(self.index, values, method).ranges(slices)
+
+      # Out is a series (e.g. Area)
+      if len(ranges) == 1:
+         return Spectrum.from_series(self, self._as_dtype(
+            Series(bands[0], index=self.columns)))
+      snames = ['%s:%s'%(rng[0],rng[1]) for rng in ranges]
+      return self._transfer(self._as_dtype(
+         DataFrame(bands, index=snames, columns=self.columns)))
 
 
    def boxcar(self, binwidth, axis=1):
@@ -778,15 +913,21 @@ class Spectra(ABCSpectra, MetaDataFrame):
       Parameters
       ----------
       binwidth: int or float
-         Width of the bin.  EG 10minutes or 5 seconds.
+         Width of the bin.  EG 10minutes or 5 seconds.  Along a DateTime
+         axis, may be a timedelta or offset string (eg '5min').
 
       axis: 0 or 1
          Average over rows or columns, respectively.
       """
-      if axis == 0 and self.varunit == 'dti':
-         raise NotImplementedError('Cannot pvutils.boxcar along DateTime axis.')
-
-      return self._transfer(pvutils.boxcar(self, binwidth=binwidth, axis=axis))
+      out = self._transfer(self._as_dtype(
+         pvutils.boxcar(self, binwidth=binwidth, axis=axis)))
+
+      # Time bins come back as DatetimeIndex; setters recast (eg TimeIndex)
+      if isinstance(out._frame.columns, DatetimeIndex):
+         out.columns = out._frame.columns
+      if isinstance(out._frame.index, DatetimeIndex):
+         out.index = out._frame.index
+      return out
 
 
    def area(self, apply_fcn='simps'):
@@ -942,7 +1083,12 @@ class Spectra(ABCSpectra, MetaDataFrame):
       if not start or not stop:
          raise badcount_error(2,1,3, argnames='start, stop, keywords')
 
-      self._frame.index = self._strict_index(np.linspace(start, stop, numpts), unit=unit)
+      index = self._strict_index(np.linspace(start, stop, numpts), unit=unit)
+
+      # Evenly spaced by construction; spare ConversionIndex the detection
+      if isinstance(index, ConversionIndex) and numpts > 1:
+         index._grid = (start, (stop - start) / (numpts - 1), int(numpts))
+      self._frame.index = index
 
 
    ###################################
@@ -956,9 +1102,13 @@ class Spectra(ABCSpectra, MetaDataFrame):
       if isinstance(self._baseline, NoneType):
          raise AttributeError('Baseline not found.')
 
-   def sub_base(self):
+   def sub_base(self, inplace=False):
       """ Subtracts baseline from entire dataset.
 
+          If inplace, the baseline is subtracted in the data buffer rather
+          than into a new frame (views of the data, eg slices of self, will
+          also change).
+
           Notes:
           -----
             Does have to call self._frame.  Just doing self.sub will not work, even though
@@ -972,7 +1122,16 @@ class Spectra(ABCSpectra, MetaDataFrame):
       if not self._base_sub:
          # Index, although should be correct, is type object and is getting falses for entries...
          logger.critical('Subtracting baseline, but may not have all: elements being equal.  Fix index')
-         self._frame = self._frame.sub(self._baseline, axis=0)
+         if inplace:
+            df = self._frame
+            values = df.values
+            if values.dtype != self._float_dtype:
+               values = np.array(values, dtype=self._float_dtype)
+            np.subtract(values, np.asarray(self._baseline)[:, np.newaxis],
+                        out=values)
+            self._frame = DataFrame(values, index=df.index, columns=df.columns)
+         else:
+            self._frame = self._frame.sub(self._baseline, axis=0)
          if self._reference is not None:
             self._reference = self._reference.sub(self._baseline, axis=0)
          self._base_sub = True
@@ -1072,8 +1231,9 @@ class Spectra(ABCSpectra, MetaDataFrame):
    @property
    def baseline(self):
       # Should these be stored as specrum?  Cause right now, just converting on return
+      # Copied, since baseline is shared by transferred Spectra.
       if self._baseline is not None:
-         return Spectrum(self._baseline.values, index=self._baseline.index)
+         return Spectrum(self._baseline.values.copy(), index=self._baseline.index)
 
 
    @baseline.setter
@@ -1084,7 +1244,7 @@ class Spectra(ABCSpectra, MetaDataFrame):
       # try an interpolation?
       # End th "valid_base"
 
-      bline=self._valid_baseline(bline)
+      bline=self._as_dtype(self._valid_baseline(bline))
 
       # Data does not current contain subtracted baseline
       if not self._base_sub:
@@ -1118,22 +1278,115 @@ class Spectra(ABCSpectra, MetaDataFrame):
       self._set_normtype(unit)
 
 
-   def as_norm(self, unit, reference=None):
+   def as_norm(self, unit, reference=None, inplace=False):
       """ Returns new Spectra of modified norm.  Useful if in-place operation not desirable.
-      Also has the option of manually passing a new reference for on-the-fly rereferencing."""
+      Also has the option of manually passing a new reference for on-the-fly rereferencing.
+
+      If inplace, self is converted and its data buffer reused rather than
+      copied (views of the data, eg slices of self, will also change)."""
       if isinstance(unit, basestring):
          if unit.lower() in ['none', 'full']:
             unit=None
 
+      if inplace:
+         self._set_normtype(unit, reference, inplace=True)
+         return
 
-      tsout = self.deepcopy()
+      # Cached norms are copied, so the cache can't be modified through tsout
+      cache = self._normcache
+      if cache is not None and reference is None:
+         key = (_valid_norm(unit), id(self._reference), self._base_sub)
+         cached = cache.get(key)
+         if cached is not None:
+            return cached._transfer(cached._frame.copy())
+
+      tsout = self._transfer(self._frame)
       tsout._set_normtype(unit, reference)
+      # No conversion was necessary
+      if tsout._frame is self._frame:
+         tsout._frame = self._frame.copy()
+
+      if cache is not None and reference is None:
+         cache.set(key, tsout._transfer(tsout._frame.copy()),
+                   nbytes=tsout._frame.values.nbytes)
       return tsout
 
 
-   def _set_normtype(self, sout, ref=None):
+   @property
+   def dtype(self):
+      """ Dtype policy (eg float32) of data and of arrays computed from it,
+      such as norms, boxcar, wavelength_slices, reference and baseline.
+      None (default, see config.SPECTRA_DTYPE) computes in float64."""
+      return self._dtype
+
+   @property
+   def _float_dtype(self):
+      # Empty dtypes (eg float32) are falsy; don't use `or`
+      if self._dtype is None:
+         return np.dtype(float)
+      return self._dtype
+
+   def _as_dtype(self, obj):
+      """ DataFrame/Series obj cast to the dtype policy, if set."""
+      if obj is None or self._dtype is None:
+         return obj
+      if isinstance(obj, DataFrame):
+         dtypes = obj.dtypes
+      else:
+         dtypes = [obj.dtype]
+      if all(dtype == self._dtype for dtype in dtypes):
+         return obj
+      return obj.astype(self._dtype)
+
+
+   def cache_norms(self, enable=True, max_bytes=None):
+      """ Store the results of as_norm() so that switching back and forth
+      between norms (eg counts, transmittance, absorbance) doesn't recompute
+      them.  Norms are keyed by norm, reference and baseline subtraction.
+
+      The cache is cleared when data, reference or baseline is reassigned,
+      or data is set by item (ts[col] = ...).  Least recently used norms
+      are dropped beyond max_bytes (default config.NORM_CACHE_BYTES).
+      Modifying the data in place by other means is not detected; call 
+      cache_norms() again to clear.  enable=False removes the cache.
+      """
+      if not enable:
+         self._normcache = None
+         return
+
+      if max_bytes is None:
+         max_bytes = pvconfig.NORM_CACHE_BYTES
+      self._normcache = LRUCache(max_bytes=max_bytes)
+
+
+   def lazy(self):
+      """ LazySpectra that records sub_base(), as_norm(), nearby[], iloc[],
+      boxcar(), wavelength_slices() and area(), and runs them on compute().
+      Slices are taken before normalization, and elementwise steps share
+      one copy of the data.
+
+      >>> ts.lazy().sub_base().as_norm('a').nearby[400:700].area().compute()
+      """
+      return LazySpectra(self)
+
+
+   def __setattr__(self, name, value):
+      """ Reassigning data, reference or baseline clears cached norms."""
+      super(Spectra, self).__setattr__(name, value)
+      if name in ('_frame', '_reference', '_baseline') and \
+         self._normcache is not None:
+         self._normcache.clear()
+
+   def __setitem__(self, key, value):
+      super(Spectra, self).__setitem__(key, value)
+      if self._normcache is not None:
+         self._normcache.clear()
+
+
+   def _set_normtype(self, sout, ref=None, inplace=False):
       """Function used to change spectral intensity representation in a convertible manner. Not called on
-      initilization of Spectra(); rather, only called by as_norm() method."""
+      initilization of Spectra(); rather, only called by as_norm() method.  Data is converted in one pass
+      by _convert_norm(), into a new array unless inplace."""
 
       sout = _valid_norm(sout)
       sin = self._normtype
@@ -1143,6 +1396,8 @@ class Spectra(ABCSpectra, MetaDataFrame):
       if sin==None and sout==None:
          return
 
+      oldref=None
+
       ########################################################################
       # Case 1: User converting from full data down to referenced data.#####
       ########################################################################
@@ -1150,18 +1405,11 @@ class Spectra(ABCSpectra, MetaDataFrame):
          rout=self._reference_valid(ref)
 
          # If user tries to downconvert but doesn't pass reference, use stored one
-         if rout == None:
+         if rout is None:
             rout = self._reference
 
-         # If ref not passed, use current reference.  Want to make sure it is
-         # not none, but have to roundabout truthtest
-         if isinstance(rout, NoneType):
+         if rout is None:
             raise TypeError('Cannot convert spectrum to norm %s without a reference'%sout)
-         else:
-            df=pvutils.divby(df, divisor=rout)
-            df=df.apply(from_T[sout])
-         #Assumes typeerror is due to rout not being a series/array, but doesn't further test it.  EG do another
-         #typeerror check of try: if rout == None: raise error
 
 
       ##############################################################
@@ -1172,18 +1420,13 @@ class Spectra(ABCSpectra, MetaDataFrame):
          # If user changing reference on the fly, need to change ref ###
          if not isinstance(ref, NoneType): #and ref != self._reference:
             rout=self._reference_valid(ref)
-
-            # Make this it's own method called change reference?
-            df=df.apply(to_T[sin])
-            df=df.mul(self._reference, axis=0)
-            df=pvutils.divby(df, divisor=rout)
-            df=df.apply(from_T[sout])
-
+            oldref=self._reference
+            if oldref is None:
+               raise TypeError('Cannot change reference of norm %s data without '
+                               'a current reference'%sin)
 
          else:
             rout=self._reference #For sake of consistent transferring at end of this function
-            df=df.apply(to_T[sin])
-            df=df.apply(from_T[sout])
 
 
       ###########################################################
@@ -1192,15 +1435,27 @@ class Spectra(ABCSpectra, MetaDataFrame):
       elif sin !=None and sout==None:
          rout=self._reference_valid(ref)
 
-         if rout == None:
+         if rout is None:
             rout=self._reference
 
-         df=df.apply(to_T[sin])
-         df=df.mul(rout, axis=0)  #Multiply up!
+         if rout is None:
+            raise TypeError('Cannot convert spectrum to full data without a reference')
+
+      # Reference may be a column (view) of the data about to be overwritten
+      if inplace and rout is not None:
+         rout = rout.copy()
+
+      dtype = self._float_dtype
+      values = df.values
+      if not inplace or values.dtype != dtype:
+         values = np.array(values, dtype=dtype)
+
+      asarray = lambda r: None if r is None else np.asarray(r, dtype=dtype)
+      _convert_norm(values, sin, sout, ref=asarray(rout), oldref=asarray(oldref))
 
-      self._reference=rout
+      self._reference=self._as_dtype(rout)
       self._normtype=sout
-      self._frame=df
+      self._frame=DataFrame(values, index=df.index, columns=df.columns)
 
    ############################################
    #####Overwrite MetaDataFrame behavior ########
@@ -1344,57 +1599,44 @@ class Spectra(ABCSpectra, MetaDataFrame):
 
       out=getattr(self._frame, attr)(*fcnargs, **fcnkwargs)
 
-      # If operation returns a dataframe, return new Spectra
-      if isinstance(out, DataFrame):
-
-         # Are there specially conserved attributes?
-         csvdout=None
-         if attr in self._cnsvdmeth:
-            if self._cnsvdattr:
-               cnsvdattr=dict((k,v) for k, v in self.cnsvdattr.iteritems()
-                              if v is not None)
-
-               csvdf=DataFrame(cnsvdattr)  #STILL WORKS WITH NONEQUAL LENGTH
-               _csvdfattrs=dict((attr, (cnsvdattr[attr].__dict__)) for attr in cnsvdattr)
-
-               try:
-                  csvdout=getattr(csvdf, attr)(*fcnargs, **fcnkwargs)
-               except Exception:
-                  raise Exception('Could not successfully perform operation "%s" on one or multiple \
-                        conserved attributes %s.'%attr, '","'.join(csvdout.columns))
-
-         # Create new timespectra object
-         tsout = self._transfer(out)
-
-         # Apply conserved attributes for example, if baseline was sliced
-         if not isinstance(csvdout, NoneType):
-
-            for col in csvdout:
-
-               # Restore custom attributes on the cnsvdattributes
-               restattr=[attr for attr in _csvdfattrs[col] if attr not in
-                         csvdout[col].__dict__]
-               if restattr:
-                  for attr in restattr:
-                     setattr(csvdout[col], attr, _csvdfattrs[col][attr])
-
-                  # Hack to conserve "name" attribute of series return
-                  try:
-                     setattr(csvdout[col], 'name', _csvdfattrs[col]['name'])
-                  except KeyError:
-                     pass
-
-               # Apply conserved attributes to new dataframe
-               setattr(tsout, col, csvdout[col])
+      # Are there specially conserved attributes?
+      cnsvdattr=None
+      if attr in self._cnsvdmeth and isinstance(out, DataFrame):
+         cnsvdattr=dict((k,v) for k, v in self.cnsvdattr.iteritems()
+                        if v is not None)
+
+      # Fast path: nothing to conserve
+      if not cnsvdattr:
+         # If operation returns a dataframe, return new Spectra
+         if isinstance(out, DataFrame):
+            return self._transfer(out)
+         elif isinstance(out, Series):
+            return Spectrum.from_series(self, out)
+         # Otherwise return whatever the method return would be
+         return out
 
+      # Create new timespectra object
+      tsout = self._transfer(out)
+
+      # Conserved attributes are aligned to the index, so slicing the rows
+      # (eg ix, iloc) slices them by the same positional indexer; slicing
+      # columns leaves them unchanged.
+      if attr == '_slice':
+         slobj = fcnkwargs.get('slobj', fcnargs[0] if fcnargs else None)
+         axis = fcnkwargs.get('axis', fcnargs[1] if len(fcnargs) > 1 else 0)
+         if axis == 0:
+            for name, value in cnsvdattr.iteritems():
+               setattr(tsout, name, _slice_conserved(value, slobj))
          return tsout
 
-      # Otherwise return whatever the method return would be
-      elif isinstance(out, Series):
-         return Spectrum.from_series(self, out)
-
-      else:
-         return out
+      # Other methods are applied to each conserved attribute
+      for name, value in cnsvdattr.iteritems():
+         try:
+            setattr(tsout, name, getattr(value, attr)(*fcnargs, **fcnkwargs))
+         except Exception:
+            raise Exception('Could not successfully perform operation "%s" on '
+                            'conserved attribute %s.' % (attr, name))
+      return tsout
 
    @property
    def _header(self):
@@ -1508,6 +1750,13 @@ class Spectra(ABCSpectra, MetaDataFrame):
       logger.info('Converting %s to R dataframe.' % self.full_name)
       return( convert_to_r_dataframe(self._frame) )
 
+   def to_mmap(self, path, chunksize=None):
+      """ Write data to a memory-mapped file at path (metadata to path.meta)
+      and return an out-of-core MmapSpectra of it.  chunksize is passed to
+      MmapSpectra."""
+      from skspec.core.mmapspectra import MmapSpectra
+      return MmapSpectra.from_spectra(self, path, chunksize=chunksize)
+
    def to_csv(self, path_or_buff, meta_separate=None, **csv_kwargs):
       """ Output to CSV file.
 
@@ -1575,7 +1824,8 @@ class Spectra(ABCSpectra, MetaDataFrame):
           set the specunit to 'dti' automatically, unles specifically set
           as None.
 
-      **kwargs: Any valid spectra or pandas readcsv() kwargs.
+      **kwargs: Any valid spectra or pandas readcsv() kwargs.  dtype
+          is the Spectra dtype policy (eg 'float32'), not a parser keyword.
 
       Returns: Spectra
       """
@@ -1603,7 +1853,6 @@ class Spectra(ABCSpectra, MetaDataFrame):
                       false_values=None,
                       delimiter=None,
                       converters=None,
-                      dtype=None,
                       usecols=None,
                       engine=None,
                       delim_whitespace=False,
@@ -1646,8 +1895,7 @@ class Spectra(ABCSpectra, MetaDataFrame):
          if not isinstance(header_datetime, basestring):
             header_datetime = '%Y/%m/%d %H:%M:%S'
 
-         df.columns = DatetimeIndex([datetime.datetime.strptime(s, header_datetime)
-                                     for s in df.columns])
+         df.columns = _parse_datetimes(df.columns, header_datetime)
 
          if 'varunit' in kwargs:
             if kwargs['varunit'] != None and kwargs['varunit'] != 'dti':
@@ -1661,8 +1909,7 @@ class Spectra(ABCSpectra, MetaDataFrame):
          if not isinstance(index_datetime, basestring):
             index_datetime = '%Y/%m/%d %H:%M:%S'
 
-         df.index = DatetimeIndex([datetime.datetime.strptime(s, index_datetime)
-                                   for s in df.index])
+         df.index = _parse_datetimes(df.index, index_datetime)
 
          if 'specunit' in kwargs:
             if kwargs['specunit'] != None and kwargs['specunit'] != 'dti':
@@ -1681,12 +1928,71 @@ class Spectra(ABCSpectra, MetaDataFrame):
       have a DataFrame and want it as a TimeSpectra, which will do its
       own index conversions.
       """
-      return cls(np.array(pandas_object.df),
+      # Already validated; only the data is copied (index, columns kept)
+      if isinstance(pandas_object, cls) and not dfkwargs:
+         dtype = pandas_object._dtype
+         if dtype is None:
+            dtype = pvconfig.SPECTRA_DTYPE
+         frame = DataFrame(np.array(pandas_object._frame.values, dtype=dtype),
+                           index=pandas_object.index,
+                           columns=pandas_object.columns)
+         return cls._from_frame(frame, dtype=dtype,
+                                strict_index=pandas_object._strict_index,
+                                strict_columns=pandas_object._strict_columns)
+
+      return cls(np.array(pandas_object),
                  index=pandas_object.index,
                  columns=pandas_object.columns,
                  **dfkwargs)
 
 
+   @classmethod
+   def _from_frame(cls, frame, name='', iunit=None, norm=None,
+                   reference=None, baseline=None, dtype=None,
+                   strict_index=SpecIndex, strict_columns=None):
+      """ Trusted constructor for internal use.  Sets the same attributes
+      as __init__(), but skips its keyword parsing, logging, unit conversion
+      and index/reference validation, so making many small Spectra (eg. per
+      window or experiment) is cheap.
+
+      frame: DataFrame whose index (and columns) are already strict_index
+          (strict_columns) in the desired units, and data of dtype.
+      reference, baseline: Series or array aligned with frame.index, or None.
+      norm: valid norm key (None, 'a', 't'...).
+      iunit: as Spectra.iunit (None for counts, the __init__() default).
+      """
+      # Cheap type checks only
+      if strict_index and not isinstance(frame.index, strict_index):
+         raise SpecError('Index type %s; require %s.' %
+                         (type(frame.index), strict_index))
+      if strict_columns and not isinstance(frame.columns, strict_columns):
+         raise SpecError('Invalid column type: %s; require %s.' %
+                         (type(frame.columns), strict_columns))
+
+      def _aligned(series):
+         if series is None or isinstance(series, Series):
+            return series
+         return Series(series, index=frame.index)
+
+      obj = cls.__new__(cls)
+      attrs = obj.__dict__
+      attrs.update(_strict_index=strict_index,
+                   _strict_columns=strict_columns,
+                   name=str(name),
+                   _dtype=np.dtype(dtype) if dtype is not None else None,
+                   _frame=frame,
+                   _normtype=norm,
+                   _reference=_aligned(reference),
+                   _base_sub=False,
+                   _baseline=_aligned(baseline))
+      obj.iunit = _count_iunit() if iunit is None else iunit
+
+      attrs['_intrinsic'] = [attr for attr in attrs if attr != 'name']
+      attrs['_cnsvdattr'] = ['_reference', '_baseline']
+      attrs['_cnsvdmeth'] = ['_slice', 'pvutils.boxcar']
+      return obj
+
+
 
 ## TESTING ###
 if __name__ == '__main__':
@@ -7,6 +7,23 @@ from skspec.units.abcunits import UnitError
 from skspec.units.intvlunit import INTVLUNITS, TimeDelta, DateTime, \
     DatetimeCanonicalError
 
+def _elapsed_ns(nanoseconds, cumsum=True):
+    """ int64 nanoseconds since the first timestamp (cumsum) or since the
+    previous timestamp (first is 0)."""
+    if cumsum:
+        return nanoseconds - nanoseconds[0]
+    elapsed = np.zeros_like(nanoseconds)
+    np.subtract(nanoseconds[1:], nanoseconds[:-1], out=elapsed[1:])
+    return elapsed
+
+def _ns_to_unit(nanoseconds, unit):
+    """ int64 nanoseconds to IntvlUnit unit in one pass (intervals, which
+    are timedelta objects, go through seconds)."""
+    if isinstance(unit, TimeDelta):
+        return unit.from_canonical(np.multiply(nanoseconds, 10**-9))
+    return np.multiply(nanoseconds, 10**-9 / unit.to_canonical(1.0))
+
+
 class TimeIndex(ConversionIndex):
     """ Stores time labels as Timestamps, Time Deltas or cumulative intervals
     ie seconds, minutes, days from t=0.  Timestamps (e.g. datetimes) are 
@@ -41,8 +58,7 @@ class TimeIndex(ConversionIndex):
                 raise IndexError("When creating TimeIndex from DatetimeIndex"
                      " unit must be 'dti' or None, recived %s" % unit)
             datetimeindex = input_array            
-            input_array = np.array(input_array.to_pydatetime())
-            input_array = np.array([Timestamp(x) for x in input_array])
+            input_array = np.asarray(input_array.astype(object))
 
             # Could force unit = DTI at this point, but are there cases
             # where they want to retain unit = None? 
@@ -117,15 +133,10 @@ class TimeIndex(ConversionIndex):
     
             #DTI TO SOMETHING ELSE            
             elif outunit != 'dti' and inunit == 'dti':
-                nanoseconds = np.diff(self.datetimeindex.asi8)  #asi8 only defined on DatetimeIndex      
-                seconds = nanoseconds * 10**-9  
-                seconds = np.insert(seconds, 0, seconds[0]-seconds[0])
-                if self.cumsum:
-                    seconds = seconds.cumsum()
-                # Seconds to datetime to new unit (hacky/three steps)
-                out = self.__class__(seconds, unit=outunit)  #THIS MAKES NP ARRAY SO ADD DATETIMEINDEX
-                out = self.unitdict[outunit].from_canonical(out)           
-                out = self.__class__(out, unit=outunit)
+                nanoseconds = self.datetimeindex.asi8  #asi8 only defined on DatetimeIndex      
+                elapsed = _elapsed_ns(nanoseconds, self.cumsum)
+                out = self.__class__(_ns_to_unit(elapsed, self.unitdict[outunit]),
+                                     unit=outunit)
 
             # Should never happen
             else:
@@ -35,6 +35,11 @@ class TimeSpectra(Spectra):
     def __init__(self, *dfargs, **dfkwargs):
         dfkwargs.setdefault('strict_columns', TimeIndex)            
         super(TimeSpectra, self).__init__(*dfargs, **dfkwargs)
+
+    @classmethod
+    def _from_frame(cls, frame, **attrs):
+        attrs.setdefault('strict_columns', TimeIndex)
+        return super(TimeSpectra, cls)._from_frame(frame, **attrs)
         
 
 ## TESTING ###
@@ -4,8 +4,10 @@
     from spec_serial.py 
     """
 
-from pandas import Series, DataFrame
+from pandas import Series, DataFrame, DatetimeIndex
+from pandas.tseries.frequencies import to_offset
 import numpy as np
+import datetime
 from scipy import integrate
 from types import GeneratorType
 
@@ -150,31 +152,131 @@ def divby(df, divisor=0, axis=0, sameshape=True):
     
             
 
-def boxcar(df, binwidth, axis=0):
-    ''' Only works on boxcar for now.  Also, want binwidth and/or binnumber
-    to be inputs but not both. '''
-    if axis==1:
-        binnumber=len(df.columns)/binwidth    
-        counts, binarray=np.histogram(df.columns, bins=binnumber)
-        digiarray=np.digitize(np.asarray(df.columns, dtype=float), binarray)          
-        mapped_series=Series(digiarray, index=df.columns)       
-        dfout=df.groupby(mapped_series, axis=1).mean()
-        dfout.columns=binarray
-    
-    elif axis==0:
-        binnumber=len(df.index)/binwidth  #Converted to int when np.histogram called
-        counts, binarray=np.histogram(df.index, bins=binnumber)
-        digiarray=np.digitize(np.asarray(df.index, dtype=float), binarray)    
-        
-        mapped_series=Series(digiarray, index=df.index)
-        
-        dfout=df.groupby(mapped_series, axis=0).mean()
-        dfout.index=binarray   
-        
+# Binning
+# -------
+def _nanoseconds(labels):
+    ''' int64 nanoseconds of datetime labels (DatetimeIndex, or Timestamps
+    eg TimeIndex in dti), or None if labels aren't datetimes.'''
+    if isinstance(labels, DatetimeIndex):
+        return labels.asi8
+    values = np.asarray(labels)
+    if values.dtype.kind == 'M':
+        return values.astype('datetime64[ns]').view('i8')
+    if values.dtype == object and len(values) and \
+       isinstance(values[0], datetime.datetime):
+        return DatetimeIndex(values).asi8
+    return None
+
+
+def _weights(out, weight_max, axis):
+    ''' Divide binned out by weight_max (scalar, or one per column (axis=0)
+    or row (axis=1)), or by its max along axis.'''
+    if weight_max is None:
+        if out.ndim == 1:
+            return out / np.nanmax(out)
+        return out / np.nanmax(out, axis=axis).reshape(
+            (1, -1) if axis == 0 else (-1, 1))
+    weight_max = np.asarray(weight_max, dtype=float)
+    if weight_max.ndim and out.ndim == 2:
+        weight_max = np.expand_dims(weight_max, axis)
+    return out / weight_max
+
+
+def bin_reduce(values, binids, axis=0, avg_fcn='mean', weight_max=None):
+    ''' Bin rows (axis=0) or columns (axis=1) of values, a 1d or 2d array,
+    by binids (one bin number per row/column).  Each bin is reduced in one 
+    pass with np.add.reduceat, rather than a pandas groupby.
+
+    Parameters:
+    -----------
+      avg_fcn: 'mean', 'sum' or 'weighted' (mean divided by weight_max, or
+        by the max of each column/row; see rebin()).  NaNs are skipped.
+
+    Returns:
+    --------
+      (bins, binned): sorted, unique bin numbers and the binned array.
+    '''
+    avg_fcn = avg_fcn.lower()
+    if avg_fcn not in ('mean', 'sum', 'weighted'):
+        raise NotImplementedError('%s is not a valid key to df_rebin, must \
+                                  be mean, sum or weighted'%avg_fcn)
+    values = np.asarray(values, dtype=float)
+    binids = np.asarray(binids)
+    if values.ndim == 1:
+        axis = 0
+    if len(binids) != values.shape[axis]:
+        raise UtilsError('%s bins for %s labels along axis %s' %
+                         (len(binids), values.shape[axis], axis))
+
+    # Bins must be contiguous for reduceat (stable, like groupby)
+    if len(binids) > 1 and (binids[1:] < binids[:-1]).any():
+        order = np.argsort(binids, kind='mergesort')
+        binids, values = binids[order], values.take(order, axis=axis)
+
+    starts = np.flatnonzero(np.r_[True, binids[1:] != binids[:-1]])
+    nans = np.isnan(values)
+    if nans.any():
+        values = np.where(nans, 0.0, values)
+        counts = np.add.reduceat((~nans).astype(int), starts, axis=axis)
     else:
+        counts = np.diff(np.r_[starts, len(binids)])
+        if values.ndim == 2:
+            counts = counts.reshape((-1, 1) if axis == 0 else (1, -1))
+
+    out = np.add.reduceat(values, starts, axis=axis)
+    if avg_fcn != 'sum':
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out = out / counts
+    if avg_fcn == 'weighted':
+        out = _weights(out, weight_max, axis)
+    return binids[starts], out
+
+
+def _binned(df, labels, binned, axis):
+    ''' Series/DataFrame of binned data from df (or Spectra), with labels 
+    along axis.'''
+    if binned.ndim == 1:
+        return Series(binned, index=labels)
+    if axis == 0:
+        return DataFrame(binned, index=labels, columns=df.columns)
+    return DataFrame(binned, index=df.index, columns=labels)
+
+
+def boxcar(df, binwidth, axis=0):
+    ''' Average rows (axis=0) or columns (axis=1) over evenly spaced bins
+    of labels, labeled by their left edge (the max label is its own bin).
+    binwidth is the number of labels per bin or, for datetime labels, may
+    be a duration (timedelta or offset string like '5min'), in which case 
+    bins start at the first timestamp.'''
+    if axis not in (0, 1):
         raise AttributeError('Axis must be 0 (column binning) or 1 (index/row) binning.  You entered %s'%axis)
-    
-    return dfout
+
+    labels = df.index if axis == 0 else df.columns
+    nanoseconds = _nanoseconds(labels)
+
+    if nanoseconds is not None:
+        start = nanoseconds.min()
+        elapsed = nanoseconds - start
+        if isinstance(binwidth, (basestring, datetime.timedelta)):
+            width = to_offset(binwidth).nanos if isinstance(binwidth, basestring) \
+                    else int(binwidth.total_seconds() * 10**9)
+            binids = elapsed // width
+        else:
+            binnumber = len(labels)/binwidth
+            width = float(elapsed.max()) / binnumber
+            binids = np.minimum(elapsed // width, binnumber - 1)
+            binids[elapsed == elapsed.max()] = binnumber   #As np.digitize
+        bins, binned = bin_reduce(np.asarray(df), binids, axis=axis)
+        edges = DatetimeIndex(start + (bins * width).astype(np.int64))
+
+    else:
+        binnumber=len(labels)/binwidth  #Converted to int when np.histogram called
+        counts, binarray=np.histogram(labels, bins=binnumber)
+        digiarray=np.digitize(np.asarray(labels, dtype=float), binarray)
+        bins, binned = bin_reduce(np.asarray(df), digiarray, axis=axis)
+        edges = binarray[bins - 1]
+
+    return _binned(df, edges, binned, axis)
 
                     
                                 
@@ -183,59 +285,16 @@ def digitize_by(df, digitized_bins, binarray, axis=0, avg_fcn='mean', weight_max
     ''' Takes in an array of digitized bins, and then restructures a dataframe
     based on the bin array'''
     
-    ### Map the digitized bins to series data with axis same as one that will be collapsed ###
-    if axis == 0:
-        mapped_series=Series(digitized_bins, index=df.index) #No, this isn't wrong, just weird
-    else:
-        #mapped_series=Series(digitized_bins, index=df.columns)
-        mapped_series=Series(digitized_bins, index=df.index)
-    
-    if len(df.shape)==1:
-        if avg_fcn.lower() == 'mean':
-            dfout=df.groupby(mapped_series).mean()  #// is importanmt
-    
-        elif avg_fcn.lower() == 'sum':
-            dfout=df.groupby(mapped_series).sum()
-    
-        ### Rebins according to the sum, and then divides axis or rows by their maxes.
-        ### If I want a normalized array, can call this with bindwidth=1.0
-        elif avg_fcn.lower() == 'weighted':
-            dfout=df.groupby(mapped_series).mean()
-            if weight_max:
-                dfout= dfout.apply(lambda x: x / weight_max)  #These should be float division
-            else:
-                dfout= dfout.apply(lambda x: x/ x.max())
-            
-        else:
-            raise NotImplementedError('%s is not a valid key to df_rebin, must \
-                                     be mean, sum or weighted'%avg_fcn)        
-    
-    elif len(df.shape)==2:
-        if avg_fcn.lower() == 'mean':
-            dfout=df.groupby(mapped_series, axis=axis).mean()
-            dfout.index=binarray
-            
-    
-        elif avg_fcn.lower() == 'sum':
-            dfout=df.groupby(mapped_series, axis=axis).sum()
-    
-        ### Rebins according to the sum, and then divides axis or rows by their maxes.
-        ### If I want a normalized array, can call this with bindwidth=1.0
-        elif avg_fcn.lower() == 'weighted':
-            dfout=df.groupby(mapped_series, axis=axis).mean()
-            if weight_max:                
-                dfout=dfout.apply(lambda x:x / weight_max, axis=axis)
-            else:
-                dfout=dfout.apply(lambda x: x / x.max(), axis=axis)            
-            
-        else:
-            raise NotImplementedError('%s is not a valid key to df_rebin, must \
-                                     be mean, sum or weighted'%avg_fcn)
-
-    else:
+    if len(df.shape) not in (1, 2):
         raise NotImplementedError('df_rebin only works with 1-d or 2-d arrays')        
-        
-    return dfout   
+
+    bins, binned = bin_reduce(np.asarray(df), digitized_bins, axis=axis,
+                              avg_fcn=avg_fcn, weight_max=weight_max)
+
+    # Means are labeled by binarray
+    if len(df.shape) == 2 and avg_fcn.lower() == 'mean':
+        bins = binarray
+    return _binned(df, bins, binned, axis)
 
 
 def split_by(df, n, axis=1, astype=list):
@@ -283,53 +342,34 @@ def rebin(df, binwidth, axis=0, avg_fcn='weighted', weight_max=None):
     
     Note: avg_fct='weighted' and weight_max=None will find a max after binning the data, 
     and divide all other column(or row values) by the max.  
-    This is not the statistical normaization, which should be added later (X-u / sigma).'''
-
+    This is not the statistical normaization, which should be added later (X-u / sigma).
 
-    if len(df.shape)==1:
-        if avg_fcn.lower() == 'mean':
-            dfout=df.groupby(lambda x:x//binwidth).mean()  #// is importanmt
-    
-        elif avg_fcn.lower() == 'sum':
-            dfout=df.groupby(lambda x:x//binwidth).sum()
-    
-        ### Rebins according to the sum, and then divides axis or rows by their maxes.
-        ### If I want a normalized array, can call this with bindwidth=1.0
-        elif avg_fcn.lower() == 'weighted':
-            dfout=df.groupby(lambda x:x//binwidth).mean()  #Groupby uses int division
-            if weight_max:
-                dfout=dfout.apply(lambda x: x / weight_max)      #Apply uses float division
-            else:
-                dfout=dfout.apply(lambda x: x/ x.max())
-            
-        else:
-            raise NotImplementedError('%s is not a valid key to df_rebin, must \
-                                     be mean, sum or weighted'%avg_fcn)        
-    
-    elif len(df.shape)==2:
-        if avg_fcn.lower() == 'mean':
-            dfout=df.groupby(lambda x:x//binwidth, axis=axis).mean()
-    
-        elif avg_fcn.lower() == 'sum':
-            dfout=df.groupby(lambda x:x//binwidth, axis=axis).sum()
-    
-        ### Rebins according to the sum, and then divides axis or rows by their maxes.
-        ### If I want a normalized array, can call this with bindwidth=1.0
-        elif avg_fcn.lower() == 'weighted':
-            dfout=df.groupby(lambda x:x//binwidth, axis=axis).mean()
-            if weight_max:                
-                dfout=dfout.apply(lambda x:x / weight_max, axis=axis)
-            else:
-                dfout=dfout.apply(lambda x: x / x.max(), axis=axis)            
-            
-        else:
-            raise NotImplementedError('%s is not a valid key to df_rebin, must \
-                                     be mean, sum or weighted'%avg_fcn)
+    Bins are labeled label // binwidth.  Datetime labels are binned by 
+    int64 nanoseconds (binwidth in nanoseconds, timedelta or offset string
+    like '5min') and labeled by the start of their bin.'''
 
-    else:
+    if len(df.shape) not in (1, 2):
         raise NotImplementedError('df_rebin only works with 1-d or 2-d arrays')        
-        
-    return dfout   
+    if len(df.shape) == 1:
+        axis = 0
+
+    labels = df.index if axis == 0 else df.columns
+    nanoseconds = _nanoseconds(labels)
+
+    if nanoseconds is not None:
+        if isinstance(binwidth, basestring):
+            binwidth = to_offset(binwidth).nanos
+        elif isinstance(binwidth, datetime.timedelta):
+            binwidth = int(binwidth.total_seconds() * 10**9)
+        binids = nanoseconds // binwidth
+    else:
+        binids = np.floor_divide(np.asarray(labels), binwidth)  #// is importanmt
+
+    bins, binned = bin_reduce(np.asarray(df), binids, axis=axis,
+                              avg_fcn=avg_fcn, weight_max=weight_max)
+    if nanoseconds is not None:
+        bins = DatetimeIndex(bins * binwidth)
+    return _binned(df, bins, binned, axis)
 
 def maxmin_xy(obj, style='max', arg=False, idx=True, val=True):
     ''' Return arg (eg integer index position), index val, and object val
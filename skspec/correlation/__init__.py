@@ -1 +1,4 @@
-from skspec.correlation.corr import Corr2d, Spec2d
\ No newline at end of file
+from skspec.correlation.corr import Corr2d, Spec2d
+from skspec.correlation.tiledcorr import TiledCorr2d
+from skspec.correlation.streamcorr import StreamingCorr2d
+from skspec.correlation.batch import corr2d_batch
@@ -0,0 +1,134 @@
+""" 2D correlation of many datasets at once (eg a SpecStack of experiments),
+computed in a pool of worker processes or threads.
+"""
+
+import logging
+logger = logging.getLogger(__name__)
+
+from collections import OrderedDict
+from multiprocessing import Pool, cpu_count
+from multiprocessing.pool import ThreadPool
+
+from skspec.core.specstack import Stack, SpecStack
+from skspec.correlation.corr import Corr2d, CorrError, Spec2d
+
+POOLS = ('process', 'thread')
+
+
+def _corr2d_outputs(args):
+    """ Corr2d of one dataset and its requested outputs.  Module-level so
+    that it can be pickled to worker processes.  If detach, the outputs'
+    reference to the dataset (eg. Spec2d.spec) is removed, so that it isn't
+    pickled back with every output; returns (outputs, detached positions).
+    """
+    spec, outputs, scale, detach, corrkwargs = args
+    cd = Corr2d(spec, **corrkwargs)
+    if scale is not None:
+        cd.scale(**scale)
+
+    out = []
+    for output in outputs:
+        if isinstance(output, basestring):
+            out.append(getattr(cd, output))
+        else:
+            out.append(output(cd))
+
+    detached = []
+    if detach:
+        for i, result in enumerate(out):
+            if isinstance(result, Spec2d) and result.spec is cd.spec:
+                result.spec = None
+                detached.append(i)
+    return out, detached
+
+
+def corr2d_batch(stack, outputs='sync', workers=None, pool='process',
+                 scale=None, **corrkwargs):
+    """ Compute Corr2d of every item in a Stack (eg SpecStack) in parallel.
+
+    Parameters
+    ----------
+    stack : Stack
+        Datasets (Spectra, TimeSpectra...) to correlate.
+
+    outputs : str, function or sequence of these
+        Corr2d attributes to return (eg 'sync', 'async', 'correlation'), or
+        functions of a Corr2d that return a summary (eg. a slice of the
+        synchronous spectrum).  With pool='process', functions must be
+        defined at module-level so they can be pickled.
+
+    workers : int
+        Number of processes/threads; defaults to the number of cpus.  If 1,
+        datasets are correlated serially without a pool.
+
+    pool : str ('process', 'thread')
+        Threads avoid copying data to workers; numpy releases the GIL
+        during matrix products, but not for the rest of Corr2d.
+
+    scale : dict
+        If passed, keyword arguments to Corr2d.scale() (eg {'alpha':0.8}).
+
+    corrkwargs :
+        Passed to Corr2d (eg async_engine, refspec).
+
+    Returns
+    -------
+    SpecStack with the same keys as stack if outputs is a single attribute
+    or function.  Otherwise, Stack of these SpecStacks keyed by output.
+    """
+    if pool not in POOLS:
+        raise CorrError('pool must be one of %s, got "%s".' %
+                        (', '.join(POOLS), pool))
+
+    if workers is None:
+        workers = cpu_count()
+    if workers < 1:
+        raise CorrError('workers must be a positive integer, got %s' % workers)
+
+    single = isinstance(outputs, basestring) or callable(outputs)
+    if single:
+        outputs = [outputs]
+
+    # Workers' data is already a copy (pickled), so Corr2d needn't copy again
+    detach = pool == 'process' and workers > 1
+    if detach:
+        corrkwargs.setdefault('copy', False)
+
+    keys, specs = zip(*stack.items())
+    tasks = [(spec, outputs, scale, detach, corrkwargs) for spec in specs]
+
+    if workers == 1:
+        results = map(_corr2d_outputs, tasks)
+    else:
+        logger.info('Correlating %s datasets with %s %s workers' %
+                    (len(tasks), workers, pool))
+        if pool == 'process':
+            workpool = Pool(workers)
+        else:
+            workpool = ThreadPool(workers)
+        try:
+            results = workpool.map(_corr2d_outputs, tasks)
+        except Exception:
+            workpool.terminate()
+            raise
+        else:
+            workpool.close()
+        finally:
+            workpool.join()
+
+    # Outputs refer to the parent's dataset instead of a pickled copy
+    for spec, (result, detached) in zip(specs, results):
+        for i in detached:
+            result[i].spec = spec
+    results = [result for result, detached in results]
+
+    stacks = []
+    for i, output in enumerate(outputs):
+        name = output if isinstance(output, basestring) else output.__name__
+        stacks.append((name, SpecStack(OrderedDict(
+            (key, result[i]) for key, result in zip(keys, results)),
+            name='%s %s' % (stack.name, name))))
+
+    if single:
+        return stacks[0][1]
+    return Stack(OrderedDict(stacks), name=stack.name)
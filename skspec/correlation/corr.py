@@ -36,13 +36,17 @@ References
 from __future__ import division
 
 import logging
+import functools
 import pandas
+from pandas import Series, DataFrame
 logger = logging.getLogger(__name__) 
 
 from math import pi
 import numpy as np
 
 from skspec.core.anyspectra import AnyFrame 
+from skspec.core.spectra import Spectrum
+from skspec.core.specstack import SpecStack
 from skspec.plotting.correlation_plot import corr2d, corr3d, corr_multi
 import skspec.config as pvconfig
 import skspec.core.utilities as pvutils
@@ -56,19 +60,68 @@ from pca_lite import PCA
 #     data_trans = matrix.transpose()
 #    return (data_trans - vector).transpose()
 
-def noda_matrix(length):
+def noda_matrix(length, dtype=float):
     ''' Length is the number of timepoints/columns in the dataframe. 
        Returns the hilbert noda Transformation matrix.'''
 
-    # XXX: how to vectorize?
-    Njk = np.empty( (length,length))
-    for j in range(length):
-        for k in range(length):
-            if j==k:
-                Njk[j,k]=0
-            else:
-                Njk[j, k]=1.0 /  ( pi * (k-j)  )  #DOUBLE CHECK j-i with old verison.    
-    return Njk
+    j, k = np.ogrid[0:length, 0:length]
+    diff = (k - j).astype(float)
+    np.fill_diagonal(diff, np.inf) # 1/inf --> 0 on diagonal
+    return np.asarray(1.0 / (pi * diff), dtype=dtype)
+
+
+def hilbert_noda(array):
+    ''' Apply the Hilbert-Noda transformation along the columns (ie the 
+    perturbation axis) of a 2d array.  Equivalent to
+    np.dot(array, noda_matrix(M).T), but computed as a zero-padded FFT
+    convolution in O(N M log M), without building the M X M matrix.  
+    Float32/complex64 arrays keep their dtype.
+    '''
+    array = np.asarray(array)
+    m = array.shape[-1]
+
+    # Pad to avoid circular wrap of the kernel; power of 2 for fft speed
+    length = 2 ** int(np.ceil(np.log2(2*m - 1)))
+
+    # Z[i,j] = sum_k X[i,k] / (pi * (k-j)) is a convolution of X with
+    # w[n] = -1 / (pi * n), w[0] = 0, for n in -(m-1) ... (m-1)
+    n = np.arange(1, m)
+    kernel = np.zeros(length)
+    kernel[1:m] = -1.0 / (pi * n)
+    kernel[length-m+1:] = (1.0 / (pi * n))[::-1]
+
+    if np.iscomplexobj(array):
+        out = np.fft.ifft(np.fft.fft(array, length, axis=-1) * 
+                          np.fft.fft(kernel), axis=-1)
+    else:
+        out = np.fft.irfft(np.fft.rfft(array, length, axis=-1) * 
+                           np.fft.rfft(kernel), length, axis=-1)
+
+    out = out[..., :m]
+    if array.dtype.kind in 'fc' and out.dtype != array.dtype:
+        out = out.astype(array.dtype)
+    return out
+
+
+# Ways to compute the asynchronous spectrum (see Corr2d.async_engine)
+ASYNC_ENGINES = ('noda', 'fft')
+
+
+def cached_matrix(fcn):
+    """ Decorator to make a Corr2d property that is computed once and stored
+    in Corr2d._cache under the property name.  Cache is cleared by
+    Corr2d._clear_cache() whenever centering or scaling changes.
+    """
+    key = fcn.__name__
+
+    @functools.wraps(fcn)
+    def wrapper(self):
+        try:
+            return self._cache[key]
+        except KeyError:
+            out = self._cache[key] = fcn(self)
+            return out
+    return property(wrapper)
 
 
 class CorrError(Exception):
@@ -134,6 +187,10 @@ class Spec2d(AnyFrame):
         arrayout : matrix values (ie synchronous spectrum)
         
         corr2d : Corr2D calling object
+
+        index, columns : Index (optional)
+            Labels of the rows/columns; both default to corr2d.index.  Used
+            when only a sub-block is computed (see Corr2d.roi()).
         
         Notes
         -----
@@ -142,6 +199,9 @@ class Spec2d(AnyFrame):
         the index and columns, respectively.
         
         """
+        index = kwargs.pop('index', corr2d.index)
+        columns = kwargs.pop('columns', corr2d.index)
+        kwargs.setdefault('dtype', getattr(corr2d.spec, 'dtype', None))
         specout = cls(
                    arrayout,
                    scaled = corr2d._scale_string, 
@@ -150,8 +210,8 @@ class Spec2d(AnyFrame):
                    *args, **kwargs
                    )
         # Set columns and index both to index
-        specout.index = corr2d.index
-        specout.columns = corr2d.index
+        specout.index = index
+        specout.columns = columns
         return specout
         
         
@@ -258,11 +318,34 @@ class Corr2d(object):
     """ Computed 2d correlation spectra, including synchronous and asynchronus,
     correlation, disrelation and other spectra given a 2d data matrix, index
     and columns.  Index and columns are necessary for plotting, so made them
-    a mandatory requirement."""
+    a mandatory requirement.
+
+    Notes
+    -----
+    Matrices (sync_noscale, joint_var etc...) are computed on first access
+    and cached.  The cache is cleared by set_center(); scaled matrices are
+    also cleared by scale() or by changing alpha/beta.  Cached arrays are
+    shared, so don't modify them in place.
+
+    If factored, sync, async, correlation and disrelation are returned as
+    FactoredSpec2d, which keep the N X M factors of the map rather than the
+    N X N matrix (see FactoredSpec2d).
+    """
+
+    # Cache keys that depend on alpha/beta and on the async engine
+    _scaled_keys = ('_sync_scaled', '_async_scaled')
+    _async_keys = ('async_noscale', 'coeff_disr', '_async_scaled', 
+                   '_async_right')
 
     # Columns aren't used; should I eliminate
-    def __init__(self, spec, refspec=None):
-        """ refspec is if you want custom centering.  """
+    def __init__(self, spec, refspec=None, async_engine='noda', factored=False,
+                 copy=True):
+        """ refspec is if you want custom centering.  async_engine is 
+        'noda' to compute asynchronous spectrum from the dense Hilbert-Noda 
+        matrix, or 'fft' to apply the transformation by FFT convolution 
+        (lower memory; faster for many timepoints).  factored returns lazy,
+        low-rank 2D spectra (useful when N >> M).  copy=False uses spec 
+        without copying it; spec must not be changed while in use. """
         if spec.ndim != 2:
             raise CorrError('Data must be 2d!')
 
@@ -272,22 +355,28 @@ class Corr2d(object):
 
 
         # MAKE AN ACTUAL COPY OF DATA, NOT PASSING BY REFERENCE
-        self.spec = spec.deepcopy()
+        if copy:
+            spec = spec.deepcopy()
+        self.spec = spec
 
         # Promote spec attributes for convenience
         self.index = spec.index   
-        self.columns = spec.columns
         self.specunit = spec.specunit
         self.varunit = spec.varunit
 
-        # Better to store than compute as a property over and over
-        self._noda = noda_matrix(self.M)
+        # Matrices computed in the data's dtype policy (eg float32)
+        dtype = getattr(spec, 'dtype', None)
+        self.dtype = np.dtype(float if dtype is None else dtype)
 
         # Defaults
+        self._cache = {}
+        self._noda = None
+        self.async_engine = async_engine
         self._scaled = False
         self.alpha = 0.8
         self.beta = 0.0
         self._PCA = None
+        self.factored = factored
 
         # Ref spectrum/dynamic spectrum/centering
         if refspec is not None:
@@ -302,9 +391,10 @@ class Corr2d(object):
 
             # Ref spectrum must be stored as an array for subtraction to work 
             # as defined here!
-            self.ref_spectrum = np.array(refspec)           
+            self.ref_spectrum = np.array(refspec, dtype=self.dtype)
             self._center = 'Pre-centered'
             self.dyn_spec = self.spec.subtract(self.ref_spectrum, axis=0)
+            self._clear_cache()
 
         else:
             self.set_center('mean')
@@ -354,6 +444,64 @@ class Corr2d(object):
             logger.warn('Alpha/Beta lose meaning off of range 0-1.')
 
 
+    @property
+    def alpha(self):
+        return self._alpha
+
+    @alpha.setter
+    def alpha(self, alpha):
+        self._alpha = alpha
+        self._clear_cache(scaled_only=True)
+
+    @property
+    def beta(self):
+        return self._beta
+
+    @beta.setter
+    def beta(self, beta):
+        self._beta = beta
+        self._clear_cache(scaled_only=True)
+
+
+    def _clear_cache(self, scaled_only=False):
+        """ Remove cached matrices.  If scaled_only, only matrices that
+        depend on alpha/beta are removed.
+        """
+        if scaled_only:
+            self._pop_cached(self._scaled_keys)
+        else:
+            self._cache.clear()
+
+    def _pop_cached(self, keys):
+        """ Remove keys from the cache, including from caches of regions 
+        returned by roi(), which are stored in self._cache.
+        """
+        caches = [self._cache] + [v for k, v in self._cache.items() 
+                                  if isinstance(k, tuple) and k[0] == 'roi']
+        for cache in caches:
+            for key in keys:
+                cache.pop(key, None)
+
+
+    @property
+    def async_engine(self):
+        return self._async_engine
+
+    @async_engine.setter
+    def async_engine(self, engine):
+        """ Change asynchronous engine; only async matrices are recomputed."""
+        if engine not in ASYNC_ENGINES:
+            raise CorrError('async_engine must be one of %s, got "%s".' % 
+                            (', '.join(ASYNC_ENGINES), engine))
+
+        # Better to store than compute as a property over and over
+        if engine == 'noda' and self._noda is None:
+            self._noda = noda_matrix(self.M, dtype=self.dtype)
+
+        self._async_engine = engine
+        self._pop_cached(self._async_keys)
+
+
     @property
     def center(self):
         return self._center
@@ -366,9 +514,8 @@ class Corr2d(object):
 
             if not style:
                 self._center = None
-                # Instead of np.zeros, I will just multiply 0 times a column
-                # To get spectrum of 0's
-                ref_spectrum = self.spec[0] * 0.0  
+                # spec[0] is a column lookup, which fails on datetime columns
+                ref_spectrum = np.zeros(self.shape[0])
 
             elif style == 'mean':
                 self._center = 'mean'
@@ -384,7 +531,7 @@ class Corr2d(object):
             raise CorrError('Center requires style of "mean", None or a '
                             ' a function, got "%s".' % style)
 
-        self.ref_spectrum = np.array(ref_spectrum)
+        self.ref_spectrum = np.array(ref_spectrum, dtype=self.dtype)
 
         if len(self.ref_spectrum) != self.shape[0]:
             raise CorrError('ref. spectrum should be of spectral length (%s)'
@@ -392,8 +539,13 @@ class Corr2d(object):
 
         # Set dynamic spectrum.  Should just be able to subtract but numpy messing up        
         self.dyn_spec = self.spec.subtract(self.ref_spectrum, axis=0)
+        self._clear_cache()
 
 
+    @property
+    def columns(self):
+        return self.spec.columns
+
     @property
     def shape(self):
         return self.spec.shape     
@@ -405,50 +557,67 @@ class Corr2d(object):
     # Numpy Arrays
     # ------------
 
-    @property
+    @cached_matrix
     def sync_noscale(self):
         """ Return unscaled, synchronous spectrum as a numpy array. """
         return np.dot(self.dyn_spec, self._dynconjtranspose) / (self.M - 1.0)  #ORDER OF OPERATIONS DEPENDENT (aka np.dot(t_dyn, dyn) doesn't work)
 
 
-    @property
+    @cached_matrix
     def async_noscale(self):
-        """ """
-        return np.dot(self.dyn_spec, np.dot(self._noda, self._dynconjtranspose) ) / (self.M-1.0)
+        """ Return unscaled, asynchronous spectrum as a numpy array. """
+        return np.dot(self.dyn_spec, self._async_right) / (self.M-1.0)
 
+    @cached_matrix
+    def _async_right(self):
+        """ M X N right-hand side of asynchronous product, N * D^H """
+        if self.async_engine == 'fft':
+            # (N * D^H)^T without the M X M noda matrix
+            return hilbert_noda(self._dyn_values.conj()).transpose()
+        return np.dot(self._noda, self._dyn_values.conj().T)
 
-    @property
+
+    @cached_matrix
     def coeff_corr(self):
         """ Correlation coefficient (pg 78) """   
         return np.divide(self.sync_noscale, self.joint_var) 
 
 
-    @property
+    @cached_matrix
     def coeff_disr(self):
         """ Disrelation coefficient (pg 79) """
         # Not the same as np.sqrt( 1 - coef_corr**2), only same in magnitude!
         return np.divide(self.async_noscale, self.joint_var)
 
-    @property
+    @cached_matrix
     def joint_var(self):
         """ Product of standard devations of dynamic spectrum. 
         s1 * s2 or sqrt(siag(sync*sync)).
         """
-        std = self.dyn_spec.std(axis=1) #sigma(lambda)
-        return np.outer(std, std)
+        return np.outer(self._std, self._std)
         #return Spec2d(np.outer(std, std),
                       #corr2d = self,
                       #name='Joint Variance',
                       #iunit='variance')
 
 
+    @cached_matrix
+    def _std(self):
+        """ Standard deviation of dynamic spectrum, sigma(lambda) """
+        return np.asarray(self.dyn_spec.std(axis=1), dtype=self.dtype)
+
+    @cached_matrix
+    def _dyn_values(self):
+        """ Dynamic spectrum as a numpy array """
+        return np.asarray(self.dyn_spec)
+
     # 11/10/14
     # I confirmed that these are equivalent to book definitions from 
     # diagonals of synchronous spectrum!  IE std = sqrt(diag(sync*sync))
     # and var = diag(sync * sync)
     # std is actually > var cuz var <1 so sqrt makes larger
 
-    @property
+    @cached_matrix
     def _dynconjtranspose(self):
         """ Dynamic spectrum conjugate transpose; helpful to be cached"""
         return np.conj(self.dyn_spec).transpose()
@@ -456,17 +625,53 @@ class Corr2d(object):
 
     # 2D Correlation Spectra
     # ----------------------
+    def _spec2d_values(self, matrix):
+        """ Values passed to Spec2d from a cached matrix.  Copied so that
+        changes to the Spec2d don't corrupt the cache."""
+        return matrix.copy()
+
+    def _factored(self, right, coeff=False, **kwargs):
+        """ FactoredSpec2d of dyn_spec * right / (M-1).  coeff divides by 
+        joint variance (correlation/disrelation), otherwise current scaling
+        is applied."""
+        if coeff:
+            transform = np.divide
+        elif self._scaled:
+            alpha, beta = self.alpha, self.beta
+            transform = lambda values, jvar: values * jvar**(-1.0 * alpha) * \
+                abs(np.divide(values, jvar))**(beta)
+        else:
+            transform = None
+        return FactoredSpec2d(self._dyn_values, right, self, 
+                              transform=transform, **kwargs)
+
+    @cached_matrix
+    def _sync_scaled(self):
+        """ Synchronous spectrum scaled by alpha, beta (Ref. [1]) """
+        return self.sync_noscale * self.joint_var**(-1.0 * self.alpha) * \
+            abs(self.coeff_corr)**(self.beta)
+            # ** faster than np.power but abs and np.abs same
+
+    @cached_matrix
+    def _async_scaled(self):
+        """ Asynchronous spectrum scaled by alpha, beta (Ref. [1]) """
+        return self.async_noscale * self.joint_var**(-1.0 * self.alpha) * \
+            abs(self.coeff_disr)**(self.beta)
+
     @property
     def sync(self):
         """ """
+        if self.factored:
+            return self._factored(self._dyn_values.conj().T,
+                                  name='Synchronous Correlation',
+                                  iunit='synchronicity')
+
         if self._scaled:
-            matrixout = self.sync_noscale * self.joint_var**(-1.0 * self.alpha) * \
-                abs(self.coeff_corr)**(self.beta)
-                    # ** faster than np.power but abs and np.abs same        
+            matrixout = self._sync_scaled
         else:
             matrixout = self.sync_noscale
 
-        return Spec2d.from_corr2d(matrixout, 
+        return Spec2d.from_corr2d(self._spec2d_values(matrixout), 
                       corr2d = self,
                       name='Synchronous Correlation',
                       iunit='synchronicity')   
@@ -474,13 +679,17 @@ class Corr2d(object):
     @property
     def async(self):
         """ """     
+        if self.factored:
+            return self._factored(self._async_right,
+                                  name='Asynchronous Correlation',
+                                  iunit='asynchronicity')
+
         if self._scaled:
-            matrixout = self.async_noscale * self.joint_var**(-1.0 * self.alpha) * \
-                abs(self.coeff_disr)**(self.beta)
+            matrixout = self._async_scaled
         else:
             matrixout = self.async_noscale
 
-        return Spec2d.from_corr2d(matrixout, 
+        return Spec2d.from_corr2d(self._spec2d_values(matrixout), 
                       corr2d = self,
                       name='Asynchronous Correlation',
                       iunit='asynchronicity')   
@@ -488,7 +697,10 @@ class Corr2d(object):
     @property
     def phase(self):
         """ Global phase angle (pg 79).  This will use scaled data."""
-        phase = np.arctan(self.async/self.sync)
+        sync, async = self.sync, self.async
+        if self.factored:
+            sync, async = sync.to_spec2d(), async.to_spec2d()
+        phase = np.arctan(async/sync)
         phase.name = 'Phase Map' 
         phase.iunit = 'phase angle'
         return phase    
@@ -497,7 +709,10 @@ class Corr2d(object):
     @property
     def modulous(self):
         """ Effective lengh the vector with components Sync/Async"""
-        modulous = np.sqrt(self.sync**2 + self.async**2)
+        sync, async = self.sync, self.async
+        if self.factored:
+            sync, async = sync.to_spec2d(), async.to_spec2d()
+        modulous = np.sqrt(sync**2 + async**2)
         modulous.name = 'Modulous'
         modulous.iunit = 'mod'
         return modulous
@@ -506,7 +721,11 @@ class Corr2d(object):
     @property
     def correlation(self):
         """ 2D Correlation Spectrum"""
-        return Spec2d.from_corr2d(self.coeff_corr, 
+        if self.factored:
+            return self._factored(self._dyn_values.conj().T, coeff=True,
+                                  name = 'Correlation Coefficient',
+                                  iunit='corr. coefficient')
+        return Spec2d.from_corr2d(self._spec2d_values(self.coeff_corr), 
                       corr2d = self,
                       name = 'Correlation Coefficient',
                       iunit='corr. coefficient')                
@@ -514,7 +733,11 @@ class Corr2d(object):
     @property
     def disrelation(self):
         """ 2D Disrelation Spectrum"""
-        return Spec2d.from_corr2d(self.coeff_disr,
+        if self.factored:
+            return self._factored(self._async_right, coeff=True,
+                                  name = 'Disrelation Coefficient',
+                                  iunit='disr. coefficient')
+        return Spec2d.from_corr2d(self._spec2d_values(self.coeff_disr),
                       corr2d = self,
                       name = 'Disrelation Coefficient',
                       iunit='disr. coefficient')   
@@ -522,12 +745,12 @@ class Corr2d(object):
 
     # 2DCodistribution Spectroscopy
     # -----------------------------
-    @property
-    def char_index(self):
-        """ Characteristic index.  In Ref. [2], this is the 
-        characteristic time, and is equation 6.
+    @cached_matrix
+    def _char_index(self):
+        """ Characteristic index as a numpy array.  Single weighted sum over
+        the perturbation axis:
 
-        Returns: Spectrum of length equivalent to spectral index.
+            K = sum_k(k * dyn_spec[:, k]) / (m * ref_spectrum) + (m+1)/2
         """
         m = self.M
 
@@ -535,54 +758,63 @@ class Corr2d(object):
         if np.count_nonzero(self.ref_spectrum) == 0:
             raise CorrError('CoDistribution divides by ref spectrum.  If'
                             ' not centring, the ref spec is 0 and you get infinities!')
-        coeff = 1.0 / (m * self.ref_spectrum)
 
-        summation = 0 
-        k_matrix = np.empty(m)
-        for k in range(1, m+1): #m+1 to include m in sum
-            k_matrix.fill(k) # in place
-            # df.mul is same as dotting:
-                #http://stackoverflow.com/questions/15753916/dot-products-in-pandas
-            summation += self.dyn_spec.dot(k_matrix) + ((m+1) / 2)
-        return coeff * summation
+        weighted = np.dot(self._dyn_values, np.arange(1, m+1))
+        return weighted / (m * self.ref_spectrum) + (m+1) / 2.0
+
+    @cached_matrix
+    def _char_perturb(self):
+        """ char_perturb as a numpy array """
+        tm, t1 = self.columns[-1], self.columns[0]
+        return ((tm-t1) * ((self._char_index-1) / (self.M -1))) + t1
 
     @property
-    def char_perturb(self):
+    def char_index(self):
         """ Characteristic index.  In Ref. [2], this is the 
         characteristic time, and is equation 6.
 
         Returns: Spectrum of length equivalent to spectral index.
         """
-        tm, t1 = self.columns[-1], self.columns[0]
-        Kj = self.char_index
-        
-        return ((tm-t1) * ((Kj-1) / (self.M -1))) + t1
+        return Spectrum.from_series(self.dyn_spec, 
+                                    Series(self._char_index, index=self.index),
+                                    name='Characteristic Index')
 
+    @property
+    def char_perturb(self):
+        """ Characteristic perturbation (eg characteristic time) at which 
+        each spectral variable is most present.  Linear map of char_index
+        onto the columns.
 
-    # TO	VECTORIZE:
+        Returns: Spectrum of length equivalent to spectral index.
+        """
+        return Spectrum.from_series(self.dyn_spec, 
+                                    Series(self._char_perturb, index=self.index),
+                                    name='Characteristic Perturbation')
+
+
+    @cached_matrix
+    def _async_codist(self):
+        """ Asynchronous codistribution as a numpy array (Ref. [2]) """
+        tm, t1 = self.columns[-1], self.columns[0]
+        tbar = self._char_perturb
+
+        # coeff[i,j] = (tbar[j] - tbar[i]) / (tm - t1)
+        coeff = (tbar[np.newaxis, :] - tbar[:, np.newaxis]) / (tm - t1)
+        # I believe std[i] std[j] is correct way
+        return coeff * self.joint_var
+
+    @cached_matrix
+    def _sync_codist(self):
+        """ Synchronous codistribution as a numpy array """
+        # In place to avoid extra N X N temporaries
+        out = self.joint_var**2
+        out -= self._async_codist**2
+        return np.sqrt(out, out)
     
     @property
     def async_codist(self):
         """ Asynchronous codistribution """
-        
-        # Empty asyn matrix
-        numrows = self.shape[0]        
-        async = np.empty((numrows,numrows))
-
-        tm, t1 = self.columns[-1], self.columns[0]
-        
-        # Numpy arrays to speed up loop/indexer?
-        tbar = self.char_perturb.values
-        var = self.joint_var
-        
-        # broadcast this?
-        for i in range(numrows):
-            for j in range(numrows):
-                coeff = (tbar[j] - tbar[i]) / (tm -t1)
-                # I believe std[i] std[j] is correct way
-                async[i][j] = coeff * var[i,j]
-
-        return Spec2d.from_corr2d(async, 
+        return Spec2d.from_corr2d(self._spec2d_values(self._async_codist), 
                       corr2d=self, 
                       name='Asynchronous Codistribution', 
                       iunit='asynchronicity')
@@ -590,23 +822,146 @@ class Corr2d(object):
     @property
     def sync_codist(self):
         """ Syncrhonous codistribution.  Computed from asyn_codist"""
-        numrows = self.shape[0]                    
-
-        # Numpy arrays to speed up calculation
-        var = self.joint_var
-        async_cod = self.async_codist.values
-        
-        sync = np.empty((numrows,numrows))
-        for i in range(numrows):
-            for j in range(numrows):
-                sync[i][j] = np.sqrt(var[i,j]**2 - async_cod[i,j]**2 )
-                 
-        return Spec2d.from_corr2d(sync, 
+        return Spec2d.from_corr2d(self._spec2d_values(self._sync_codist), 
                       corr2d=self, 
                       name='Synchronous Codistribution', 
                       iunit='synchronicity')
     
 
+    def moving_window(self, width, step=1, maps=False):
+        """ Moving-window 2D correlation (MW2D).  Slides a window of width
+        columns along the perturbation axis and computes the synchronous 
+        autopower (diagonal of the synchronous spectrum) of each window, with
+        spectra centered on the window mean.  Window sums are updated 
+        incrementally as columns enter and leave the window (rank-one 
+        add/remove) rather than recomputed per window.
+
+        Parameters
+        ----------
+        width : int
+            Number of columns in each window (at least 2).
+
+        step : int (1)
+            Number of columns between successive windows.
+
+        maps : bool (False)
+            Also return the synchronous spectrum of every window.  Costs 
+            O(N**2) memory and time per window.
+
+        Returns
+        -------
+        autopower : Spectra of autopower (spectral index X window center).  
+            If maps, returns (autopower, SpecStack of Spec2d) where stack is
+            keyed by window center.
+        """
+        m = self.M
+        width, step = int(width), int(step)
+        if width < 2 or width > m:
+            raise CorrError('Window width must be between 2 and %s, got %s' 
+                            % (m, width))
+        if step < 1:
+            raise CorrError('Window step must be a positive integer, got %s' 
+                            % step)
+
+        # Variance is unchanged by a shift; subtracting the global mean keeps
+        # the running sums of squares from losing precision to a large offset
+        values = np.asarray(self.spec, dtype=self.dtype)
+        values = values - values.mean(axis=1)[:, np.newaxis]
+
+        starts = range(0, m - width + 1, step)
+        centers = [start + width // 2 for start in starts]
+        power = np.empty((values.shape[0], len(starts)), dtype=self.dtype)
+        sync_maps = []
+
+        window = values[:, 0:width]
+        sum1 = window.sum(axis=1)
+        sum2 = (window**2).sum(axis=1)
+        if maps:
+            cross = np.dot(window, window.transpose())
+
+        for i, start in enumerate(starts):
+            if i:
+                # Columns that left / entered since previous window
+                prev = starts[i-1]
+                old = values[:, prev:min(start, prev + width)]
+                new = values[:, max(prev + width, start):start + width]
+                sum1 += new.sum(axis=1) - old.sum(axis=1)
+                sum2 += (new**2).sum(axis=1) - (old**2).sum(axis=1)
+                if maps:
+                    cross += np.dot(new, new.transpose()) - \
+                             np.dot(old, old.transpose())
+
+            power[:, i] = (sum2 - sum1**2 / width) / (width - 1.0)
+
+            if maps:
+                sync = (cross - np.outer(sum1, sum1) / width) / (width - 1.0)
+                sync_maps.append(Spec2d.from_corr2d(sync,
+                      corr2d = self,
+                      name='Synchronous Correlation (window %s)' % (i),
+                      iunit='synchronicity'))
+
+        autopower = self.spec._transfer(DataFrame(power, index=self.index,
+                                            columns=self.columns[centers]))
+        autopower.name = 'Moving Window Autopower'
+        autopower.iunit = 'autopower'
+
+        if maps:
+            keys = [str(label) for label in autopower.columns]
+            return autopower, SpecStack(zip(keys, sync_maps), 
+                                        name='Moving Window Synchronous')
+        return autopower
+
+
+    def _range_rows(self, rng):
+        """ Positions (start, stop) of the spectral range rng, a (start, stop)
+        pair or slice of index values.  Like Spectra.nearby, the nearest index
+        values are used, both ends are included and None means open-ended.
+        """
+        if isinstance(rng, slice):
+            rng = (rng.start, rng.stop)
+        if len(rng) != 2:
+            raise CorrError('Range must be a (start, stop) pair, got %s' 
+                            % str(rng))
+
+        values = np.asarray(self.index, dtype=float)
+        vmin, vmax = values.min(), values.max()
+        rows = []
+        for value, default in zip(rng, (0, len(values) - 1)):
+            if value is None:
+                rows.append(default)
+            elif value < vmin or value > vmax:
+                raise CorrError('%s is outside of index range %s - %s' 
+                                % (value, vmin, vmax))
+            else:
+                rows.append(np.abs(values - value).argmin())
+
+        # Descending index (eg cm-1) or reversed range
+        start, stop = sorted(rows)
+        return (int(start), int(stop) + 1)
+
+
+    def roi(self, range1, range2=None):
+        """ Region of interest: correlation between two spectral ranges.  
+        Only the rectangular block of each 2D spectrum is computed, so cost 
+        scales as len(range1) * len(range2) rather than N**2.
+
+        Parameters
+        ----------
+        range1, range2 : (start, stop) or slice
+            Spectral ranges of the rows and columns, in index units, as would
+            be passed to Spectra.nearby (eg (1400, 1500)).  range2 defaults to
+            range1.
+
+        Returns
+        -------
+        Corr2dROI with sync, async, correlation etc... as Spec2d blocks.
+        """
+        if range2 is None:
+            range2 = range1
+        return Corr2dROI(self, self._range_rows(range1), 
+                         self._range_rows(range2))
+
+
     def plot(self, **pltkwargs):
         """ Quad plot shows several kinds of correlation plots."""
         return corr_multi(self, **pltkwargs)
@@ -727,12 +1082,257 @@ class Corr2d(object):
         else:
             outstring += '%sScaled    -->  %s\n' % (pad, self._scaled)        
 
+        outstring += '%sAsync     -->  %s\n' % (pad, self.async_engine)
+
         outstring += '%sUnits     -->  [%s X %s]' % (pad, 
                                                      self.specunit.lower(), 
                                                      self.varunit.lower())
         return outstring
 
 
+class Corr2dROI(object):
+    """ Rectangular block of the 2D correlation spectra of a Corr2d between 
+    two spectral regions, ie dyn_spec[r1] * f(dyn_spec[r2])^H.  Returned by 
+    Corr2d.roi().  Centering, scaling and async_engine are those of the 
+    parent Corr2d, and matrices are cached on the parent so that they are 
+    cleared along with the parent's.
+    """
+
+    def __init__(self, corr2d, rows1, rows2):
+        """ rows1, rows2 are (start, stop) positions along corr2d.index """
+        self.corr2d = corr2d
+        self._rows1 = rows1
+        self._rows2 = rows2
+        self.index = corr2d.index[slice(*rows1)]
+        self.columns = corr2d.index[slice(*rows2)]
+
+    @property
+    def _cache(self):
+        return self.corr2d._cache.setdefault(('roi', self._rows1, 
+                                              self._rows2), {})
+
+    @property
+    def shape(self):
+        return (len(self.index), len(self.columns))
+
+    @property
+    def M(self):
+        return self.corr2d.M
+
+    # Numpy Arrays
+    # ------------
+    @property
+    def _dyn1(self):
+        return self.corr2d._dyn_values[slice(*self._rows1)]
+
+    @property
+    def _dyn2(self):
+        return self.corr2d._dyn_values[slice(*self._rows2)]
+
+    @cached_matrix
+    def sync_noscale(self):
+        """ Unscaled synchronous block as a numpy array. """
+        return np.dot(self._dyn1, np.conj(self._dyn2).transpose()) / (self.M - 1.0)
+
+    @cached_matrix
+    def async_noscale(self):
+        """ Unscaled asynchronous block as a numpy array. """
+        conj2 = np.conj(self._dyn2)
+        if self.corr2d.async_engine == 'fft':
+            right = hilbert_noda(conj2).transpose()
+        else:
+            right = np.dot(self.corr2d._noda, conj2.transpose())
+        return np.dot(self._dyn1, right) / (self.M - 1.0)
+
+    @cached_matrix
+    def joint_var(self):
+        std = self.corr2d._std
+        return np.outer(std[slice(*self._rows1)], std[slice(*self._rows2)])
+
+    @cached_matrix
+    def coeff_corr(self):
+        return np.divide(self.sync_noscale, self.joint_var)
+
+    @cached_matrix
+    def coeff_disr(self):
+        return np.divide(self.async_noscale, self.joint_var)
+
+    @cached_matrix
+    def _sync_scaled(self):
+        return self.sync_noscale * self.joint_var**(-1.0 * self.corr2d.alpha) * \
+            abs(self.coeff_corr)**(self.corr2d.beta)
+
+    @cached_matrix
+    def _async_scaled(self):
+        return self.async_noscale * self.joint_var**(-1.0 * self.corr2d.alpha) * \
+            abs(self.coeff_disr)**(self.corr2d.beta)
+
+    def _sync_async(self):
+        if self.corr2d._scaled:
+            return self._sync_scaled, self._async_scaled
+        return self.sync_noscale, self.async_noscale
+
+    # 2D Correlation Spectra
+    # ----------------------
+    def _spec2d(self, matrix, **kwargs):
+        return Spec2d.from_corr2d(matrix.copy(),
+                      corr2d = self.corr2d,
+                      index = self.index,
+                      columns = self.columns,
+                      **kwargs)
+
+    @property
+    def sync(self):
+        return self._spec2d(self._sync_async()[0],
+                      name='Synchronous Correlation',
+                      iunit='synchronicity')
+
+    @property
+    def async(self):
+        return self._spec2d(self._sync_async()[1],
+                      name='Asynchronous Correlation',
+                      iunit='asynchronicity')
+
+    @property
+    def phase(self):
+        """ Global phase angle (pg 79).  This will use scaled data."""
+        sync, async = self._sync_async()
+        return self._spec2d(np.arctan(async / sync),
+                      name='Phase Map',
+                      iunit='phase angle')
+
+    @property
+    def modulous(self):
+        """ Effective lengh the vector with components Sync/Async"""
+        sync, async = self._sync_async()
+        return self._spec2d(np.sqrt(sync**2 + async**2),
+                      name='Modulous',
+                      iunit='mod')
+
+    @property
+    def correlation(self):
+        return self._spec2d(self.coeff_corr,
+                      name = 'Correlation Coefficient',
+                      iunit='corr. coefficient')
+
+    @property
+    def disrelation(self):
+        return self._spec2d(self.coeff_disr,
+                      name = 'Disrelation Coefficient',
+                      iunit='disr. coefficient')
+
+    def __repr__(self):
+        address = super(Corr2dROI, self).__repr__().split()[-1].strip("'").strip('>')
+        return '%s (%s X %s) at %s of:\n%s' % (self.__class__.__name__,
+                                              self.shape[0], self.shape[1],
+                                              address, self.corr2d)
+
+
+class FactoredSpec2d(object):
+    """ Lazy 2D spectrum stored as factors, left * right / (M-1), where left
+    is the N X M dynamic spectrum and right is M X N (ie D^H for synchronous,
+    N * D^H for asynchronous).  These maps have rank <= M, so the factors need
+    O(NM) memory instead of O(N**2) when N >> M.  Slices, the diagonal,
+    sub-blocks and downsampled renderings are computed on demand; the full
+    map is only computed by to_spec2d().  Returned by Corr2d.sync, async,
+    correlation and disrelation when Corr2d.factored is True.
+    """
+
+    def __init__(self, left, right, corr2d, transform=None, name='', iunit=None):
+        """ transform(values, jvar) is applied to computed elements, where
+        jvar is their joint variance (eg scaling, correlation coefficient).
+        Factors are those of corr2d at creation, so later changes to corr2d
+        (centering, scaling) don't change this spectrum.
+        """
+        self.corr2d = corr2d
+        self.left = left
+        self.right = right
+        self.transform = transform
+        self.name = name
+        self.iunit = iunit
+        self.index = corr2d.index
+        self._std = corr2d._std
+        self._denom = corr2d.M - 1.0
+
+    @property
+    def shape(self):
+        return (self.left.shape[0], self.right.shape[1])
+
+    def _values(self, rows, cols):
+        """ Block of the map as a numpy array; rows, cols are slices."""
+        out = np.dot(self.left[rows], self.right[:, cols]) / self._denom
+        if self.transform is not None:
+            out = self.transform(out, np.outer(self._std[rows], 
+                                               self._std[cols]))
+        return out
+
+    def _spec2d(self, rows, cols, **kwargs):
+        kwargs.setdefault('name', self.name)
+        return Spec2d.from_corr2d(self._values(rows, cols),
+                      corr2d = self.corr2d,
+                      index = self.index[rows],
+                      columns = self.index[cols],
+                      iunit = self.iunit,
+                      **kwargs)
+
+    def _spectrum(self, values, name):
+        return Spectrum.from_series(self.corr2d.dyn_spec, 
+                                    Series(values, index=self.index),
+                                    name=name)
+
+    def diagonal(self):
+        """ Diagonal of the map (ie autopower spectrum for synchronous)
+        as a Spectrum. """
+        values = np.einsum('ij,ji->i', self.left, self.right) / self._denom
+        if self.transform is not None:
+            values = self.transform(values, self._std**2)
+        return self._spectrum(values, '%s (diagonal)' % self.name)
+
+    def spectrum(self, value, axis=0):
+        """ Row (axis=0) or column (axis=1) of the map at the index value 
+        nearest to value, as a Spectrum. """
+        pos = self.corr2d._range_rows((value, value))[0]
+        full = slice(None)
+        if axis == 0:
+            values = self._values(slice(pos, pos+1), full)[0]
+        elif axis == 1:
+            values = self._values(full, slice(pos, pos+1))[:, 0]
+        else:
+            raise Spec2dError('axis must be 0 or 1, got "%s"' % axis)
+        return self._spectrum(values, '%s at %s' % (self.name, 
+                                                    self.index[pos]))
+
+    def block(self, range1, range2=None):
+        """ Spec2d of the sub-block between two spectral ranges, given as 
+        in Corr2d.roi().  range2 defaults to range1. """
+        if range2 is None:
+            range2 = range1
+        return self._spec2d(slice(*self.corr2d._range_rows(range1)),
+                            slice(*self.corr2d._range_rows(range2)))
+
+    def render(self, points=500):
+        """ Spec2d downsampled by a constant step to at most points rows and
+        columns (eg for plotting). """
+        step = max(1, int(np.ceil(self.shape[0] / float(points))))
+        rows = slice(None, None, step)
+        return self._spec2d(rows, rows)
+
+    def plot(self, **pltkwargs):
+        """ Plot of render(); points is passed to render. """
+        points = pltkwargs.pop('points', 500)
+        return self.render(points).plot(**pltkwargs)
+
+    def to_spec2d(self):
+        """ Full N X N Spec2d. """
+        full = slice(None)
+        return self._spec2d(full, full)
+
+    def __repr__(self):
+        return '%s "%s" (%s X %s, rank <= %s)' % (self.__class__.__name__, 
+                    self.name, self.shape[0], self.shape[1], 
+                    self.left.shape[1])
+
+
 if __name__ == '__main__':
     from skspec.data import aunps_glass, solvent_evap, aunps_water
     import numpy as np
@@ -0,0 +1,147 @@
+""" 2D correlation for spectra that arrive one at a time (eg. during an
+acquisition).  The mean spectrum and the centered cross-product are updated
+incrementally, so the synchronous and correlation maps are current after each
+new spectrum at O(N**2) cost, instead of refitting the full N X M dataset.
+"""
+
+from __future__ import division
+
+import logging
+logger = logging.getLogger(__name__)
+
+import numpy as np
+from pandas import DataFrame, concat
+
+from skspec.correlation.corr import Corr2d, CorrError, cached_matrix, \
+     noda_matrix
+
+
+class StreamingCorr2d(Corr2d):
+    """ Corr2d that accepts new spectra through update().  Synchronous
+    spectrum, joint variance and correlation coefficients are computed from
+    a running mean and cross-product (Welford's update), so each is O(N**2)
+    after an update.  Asynchronous spectrum and other quantities that need
+    the whole dataset (char_index, moving_window...) are recomputed lazily
+    when accessed; new spectra are only appended to self.spec at that time.
+
+    Notes
+    -----
+    Only "mean" and None centering are supported, as the reference spectrum
+    must be updated incrementally.  Default async_engine is 'fft', since the
+    Hilbert-Noda matrix would have to be rebuilt as timepoints are added.
+    """
+
+    def __init__(self, spec, **kwargs):
+        """ spec is initial dataset (may be a single spectrum).  kwargs passed
+        to Corr2d, except refspec, which isn't supported."""
+        if kwargs.get('refspec', None) is not None:
+            raise CorrError('StreamingCorr2d does not support refspec; '
+                            'center must be "mean" or None.')
+        kwargs.setdefault('async_engine', 'fft')
+
+        # Accumulators must exist before Corr2d.__init__ (sets async_engine)
+        values = np.asarray(spec, dtype=float)
+        self._pending = []
+        self._count = values.shape[1]
+        self._mean = values.mean(axis=1)
+        dyn = values - self._mean[:, np.newaxis]
+        self._comoment = np.dot(dyn, dyn.transpose())
+
+        super(StreamingCorr2d, self).__init__(spec, **kwargs)
+
+
+    def update(self, spectrum, label=None):
+        """ Add a new spectrum (column) to the dataset.  spectrum is a
+        Spectrum, Series or array of spectral length.  label is its column
+        value (eg time); defaults to spectrum.name, or its position in the
+        dataset if spectrum has no name.
+        """
+        values = np.asarray(spectrum, dtype=float)
+        if values.shape != (self.shape[0],):
+            raise CorrError('Spectrum shape %s does not match spectral length'
+                            ' (%s).' % (values.shape, self.shape[0]))
+
+        if label is None:
+            label = getattr(spectrum, 'name', None)
+            if label is None:
+                label = self._count
+
+        # Welford's update of mean and centered cross-product
+        self._count += 1
+        delta = values - self._mean
+        self._mean += delta / self._count
+        self._comoment += np.outer(delta, delta) * \
+            ((self._count - 1.0) / self._count)
+
+        self._pending.append((label, values))
+        self._clear_cache()
+
+
+    @property
+    def spec(self):
+        """ Full dataset; spectra added by update() are appended on access."""
+        if self._pending:
+            labels, values = zip(*self._pending)
+            new = DataFrame(np.column_stack(values), index=self._spec.index,
+                            columns=list(labels))
+            frame = concat([self._spec._frame, new], axis=1)
+            spec = self._spec._transfer(frame)
+            spec.columns = frame.columns  # Recast to spectra's column type
+            self._spec = spec
+            self._pending = []
+        return self._spec
+
+    @spec.setter
+    def spec(self, spec):
+        self._spec = spec
+
+
+    @property
+    def shape(self):
+        return (len(self.index), self._count)
+
+
+    def set_center(self, style, *args, **kwargs):
+        """ Center by "mean" or None. """
+        if not style:
+            self._center = None
+        elif style == 'mean':
+            self._center = 'mean'
+        else:
+            raise CorrError('StreamingCorr2d center must be "mean" or None, '
+                            'got "%s".' % style)
+        self._clear_cache()
+
+    @property
+    def ref_spectrum(self):
+        if self._center is None:
+            return np.zeros(self.shape[0])
+        return self._mean.copy()
+
+    @cached_matrix
+    def dyn_spec(self):
+        return self.spec.subtract(self.ref_spectrum, axis=0)
+
+
+    # Matrices from accumulators
+    # --------------------------
+    @cached_matrix
+    def sync_noscale(self):
+        """ Unscaled synchronous spectrum from running cross-product. """
+        if self._center is None:
+            return (self._comoment + self._count *
+                    np.outer(self._mean, self._mean)) / (self.M - 1.0)
+        return self._comoment / (self.M - 1.0)
+
+    @cached_matrix
+    def _std(self):
+        """ Standard deviation of dynamic spectrum from diag. of cross-product"""
+        return np.sqrt(np.diag(self._comoment) / (self.M - 1.0))
+
+    @cached_matrix
+    def _async_right(self):
+        """ Hilbert-Noda matrix is rebuilt if timepoints were added."""
+        if self.async_engine == 'noda' and \
+           (self._noda is None or len(self._noda) != self.M):
+            self._noda = noda_matrix(self.M, dtype=self.dtype)
+        return Corr2d._async_right.fget(self)
@@ -0,0 +1,230 @@
+""" Out-of-core 2D correlation for very large spectral axes.  Each N X N map
+is computed in blocks of rows (tiles) and written to a memory-mapped .npy
+file, so peak memory scales with the tile size rather than N**2.  At 10k
+spectral points a single float64 map is ~800MB; a quad plot holds several.
+"""
+
+from __future__ import division
+
+import os
+import shutil
+import tempfile
+import logging
+logger = logging.getLogger(__name__)
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from skspec.correlation.corr import Corr2d, Spec2d, CorrError, cached_matrix
+
+
+class TiledCorr2d(Corr2d):
+    """ Corr2d whose N X N matrices are computed tile by tile into
+    memory-mapped .npy files.  Spec2d objects returned by sync, async,
+    correlation etc... are backed by these memmaps (copy-on-write, so
+    changes to a Spec2d are never written back to disk).
+
+    Notes
+    -----
+    Files are written to self.directory, a new temporary directory unless
+    one is passed.  Call cleanup() to delete it when finished.  Operations
+    on the returned Spec2d (eg sync + async) will still create in-memory
+    arrays.
+    """
+
+    def __init__(self, spec, refspec=None, tile_size=1024, directory=None,
+                 **kwargs):
+        """ tile_size is the number of rows computed at once; memory per tile
+        is roughly tile_size * N * 8 bytes.  directory is where .npy files are
+        stored.  Other kwargs passed to Corr2d.
+        """
+        if tile_size < 1:
+            raise CorrError('tile_size must be a positive integer, got %s'
+                            % tile_size)
+        self.tile_size = int(tile_size)
+
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix='skspec_corr_')
+        elif not os.path.isdir(directory):
+            os.makedirs(directory)
+        self.directory = directory
+
+        super(TiledCorr2d, self).__init__(spec, refspec=refspec, **kwargs)
+
+
+    def cleanup(self):
+        """ Delete self.directory and all memory-mapped matrices in it.
+        Spec2d objects already returned remain valid until closed on
+        posix systems."""
+        self._clear_cache()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+    # Phase and modulous memmaps are cached per scaling state
+    _scaled_keys = Corr2d._scaled_keys + ('_phase_scaled', '_modulous_scaled')
+    _async_keys = Corr2d._async_keys + ('_phase_scaled', '_phase_noscale',
+                                        '_modulous_scaled', '_modulous_noscale')
+
+    def _remove_dropped(self, old):
+        """ Delete the files of memmaps in old (a copy of the cache) that
+        are no longer cached."""
+        for key, value in old.items():
+            if key not in self._cache and isinstance(value, np.memmap):
+                try:
+                    os.remove(value.filename)
+                except OSError:
+                    pass
+
+    def _clear_cache(self, scaled_only=False):
+        """ Also deletes the files of memmaps dropped from the cache."""
+        old = dict(self._cache)
+        super(TiledCorr2d, self)._clear_cache(scaled_only=scaled_only)
+        self._remove_dropped(old)
+
+    def _pop_cached(self, keys):
+        """ Also deletes the files of memmaps dropped from the cache."""
+        old = dict(self._cache)
+        super(TiledCorr2d, self)._pop_cached(keys)
+        self._remove_dropped(old)
+
+
+    def _tile_matrix(self, key, tilefcn):
+        """ Fill N X N .npy file in self.directory by rows, where tilefcn(rows)
+        returns the block self[rows, :] for a slice, rows.  Returns
+        copy-on-write memmap of file.
+        """
+        n = self.shape[0]
+        fd, path = tempfile.mkstemp(prefix='%s_' % key.strip('_'),
+                                    suffix='.npy', dir=self.directory)
+        os.close(fd)
+
+        out = None
+        for start in range(0, n, self.tile_size):
+            rows = slice(start, min(start + self.tile_size, n))
+            tile = tilefcn(rows)
+            # Dtype not known until first tile (ie complex data)
+            if out is None:
+                out = open_memmap(path, mode='w+', dtype=tile.dtype,
+                                  shape=(n, n))
+            out[rows] = tile
+
+        out.flush()
+        del out
+        logger.debug('Wrote %s X %s matrix "%s" to %s' % (n, n, key, path))
+        return np.load(path, mmap_mode='c')
+
+
+    def _spec2d_values(self, matrix):
+        """ Memmaps are copy-on-write; no need to copy into memory."""
+        return matrix
+
+
+    def _joint_var_tile(self, rows):
+        return np.outer(self._std[rows], self._std)
+
+
+    # N X N memmaps
+    # -------------
+    @cached_matrix
+    def sync_noscale(self):
+        """ Unscaled synchronous spectrum as a memory-mapped array. """
+        return self._tile_matrix('sync_noscale', lambda rows:
+            np.dot(self._dyn_values[rows], self._dynconjtranspose) / (self.M - 1.0))
+
+    @cached_matrix
+    def async_noscale(self):
+        """ Unscaled asynchronous spectrum as a memory-mapped array. """
+        return self._tile_matrix('async_noscale', lambda rows:
+            np.dot(self._dyn_values[rows], self._async_right) / (self.M - 1.0))
+
+    @cached_matrix
+    def joint_var(self):
+        return self._tile_matrix('joint_var', self._joint_var_tile)
+
+    @cached_matrix
+    def coeff_corr(self):
+        return self._tile_matrix('coeff_corr', lambda rows:
+            np.divide(self.sync_noscale[rows], self._joint_var_tile(rows)))
+
+    @cached_matrix
+    def coeff_disr(self):
+        return self._tile_matrix('coeff_disr', lambda rows:
+            np.divide(self.async_noscale[rows], self._joint_var_tile(rows)))
+
+    def _scaled_tile(self, matrix, rows):
+        """ Scale rows of sync/async noscale matrix (Ref. [1] of Corr2d) """
+        block = matrix[rows]
+        jvar = self._joint_var_tile(rows)
+        return block * jvar**(-1.0 * self.alpha) * \
+            abs(np.divide(block, jvar))**(self.beta)
+
+    @cached_matrix
+    def _sync_scaled(self):
+        return self._tile_matrix('sync_scaled', lambda rows:
+            self._scaled_tile(self.sync_noscale, rows))
+
+    @cached_matrix
+    def _async_scaled(self):
+        return self._tile_matrix('async_scaled', lambda rows:
+            self._scaled_tile(self.async_noscale, rows))
+
+
+    @cached_matrix
+    def _async_codist(self):
+        tm, t1 = self.columns[-1], self.columns[0]
+        tbar = self._char_perturb
+        return self._tile_matrix('async_codist', lambda rows:
+            (tbar[np.newaxis, :] - tbar[rows, np.newaxis]) / (tm - t1) * 
+            self._joint_var_tile(rows))
+
+    @cached_matrix
+    def _sync_codist(self):
+        return self._tile_matrix('sync_codist', lambda rows:
+            np.sqrt(self._joint_var_tile(rows)**2 - self._async_codist[rows]**2))
+
+
+    # Phase and modulous, for the unscaled and scaled sync/async
+    # -----------------------------------------------------------
+    @cached_matrix
+    def _phase_noscale(self):
+        return self._tile_matrix('phase_noscale', lambda rows:
+            np.arctan(self.async_noscale[rows] / self.sync_noscale[rows]))
+
+    @cached_matrix
+    def _phase_scaled(self):
+        return self._tile_matrix('phase_scaled', lambda rows:
+            np.arctan(self._async_scaled[rows] / self._sync_scaled[rows]))
+
+    @cached_matrix
+    def _modulous_noscale(self):
+        return self._tile_matrix('modulous_noscale', lambda rows:
+            np.sqrt(self.sync_noscale[rows]**2 + self.async_noscale[rows]**2))
+
+    @cached_matrix
+    def _modulous_scaled(self):
+        return self._tile_matrix('modulous_scaled', lambda rows:
+            np.sqrt(self._sync_scaled[rows]**2 + self._async_scaled[rows]**2))
+
+    @property
+    def phase(self):
+        """ Global phase angle (pg 79).  This will use scaled data."""
+        if self._scaled:
+            matrixout = self._phase_scaled
+        else:
+            matrixout = self._phase_noscale
+        return Spec2d.from_corr2d(matrixout,
+                      corr2d = self,
+                      name='Phase Map',
+                      iunit='phase angle')
+
+    @property
+    def modulous(self):
+        """ Effective lengh the vector with components Sync/Async"""
+        if self._scaled:
+            matrixout = self._modulous_scaled
+        else:
+            matrixout = self._modulous_noscale
+        return Spec2d.from_corr2d(matrixout,
+                      corr2d = self,
+                      name='Modulous',
+                      iunit='mod')
@@ -28,6 +28,19 @@ logger = logging.getLogger(__name__)
 #       attr as if user tried self.a and self._frame.a existed, it would call this...
 _dfattrs=[x for x in dir(DataFrame) if '__' not in x]
 
+# Cache of (pandas class, attribute) --> True if attribute is a method.  Used
+# by __getattr__ to dispatch without inspecting the bound attribute each call.
+_ismethod = {}
+
+def _is_method(cls, attr):
+    """ Is attr an (unbound) method of pandas class, cls? Cached."""
+    try:
+        return _ismethod[cls, attr]
+    except KeyError:
+        out = _ismethod[cls, attr] = isinstance(getattr(cls, attr, None), 
+                                                MethodType)
+        return out
+
 #----------------------------------------------------------------------
 # Loading (perhaps change name?) ... Doesn't work correctly as instance methods
 
@@ -92,24 +105,26 @@ class MetaPandasObject(object):
         ''' Tells python how to handle all attributes that are not found.
         Basic attributes are directly referenced to self._frame; however, 
         instance methods (like df.corr() ) are handled specially using a
-        special private parsing method, _framegetattr().'''
+        special private parsing method, _framegetattr().  Whether attr is a
+        method is looked up once per pandas class (see _is_method).'''
+
+        # Not set yet (eg unpickling); avoid recursion through self._frame
+        if attr == '_frame':
+            raise AttributeError('_frame')
+
+        # Handle instance methods using _framegetattr().
+        # see http://stackoverflow.com/questions/3434938/python-allowing-methods-not-specifically-defined-to-be-called-ala-getattr
+        if _is_method(type(self._frame), attr):
+            return functools.partial(self._framegetattr, attr, *fcnargs, **fcnkwargs)
+            # This is a reference to the fuction (aka a wrapper) not the function itself
 
         # Return basic attribute        
         try:
-            refout = getattr(self._frame, attr)
+            return getattr(self._frame, attr)
         except AttributeError:
             raise AttributeError('Either failed to find attribute "%s" in %s or '
              'its underlying pandas object, or it is found, but throwing an error'
              ' when accessed.'%(attr, self.__class__.__name__))           
-           
-        if not isinstance(refout, MethodType):
-            return refout
-
-        # Handle instance methods using _framegetattr().
-        # see http://stackoverflow.com/questions/3434938/python-allowing-methods-not-specifically-defined-to-be-called-ala-getattr
-        else:         
-            return functools.partial(self._framegetattr, attr, *fcnargs, **fcnkwargs)
-            # This is a reference to the fuction (aka a wrapper) not the function itself
             
     def __setattr__(self, name, value):
         ''' When user sets an attribute, this tries to intercept any name conflicts.  For example, if user attempts to set
@@ -128,17 +143,24 @@ class MetaPandasObject(object):
     def _transfer(self, dfnew):
         """ Copy current attributes into a new dataframe.  For methods that
         return a dataframe and need to append current attributes/columns/index.
+
+        Only metadata is copied, and shallowly: attribute values are shared
+        with self (copy-on-write), so they must be replaced rather than
+        modified in place.  Lists, dicts and sets are copied.  Use deepcopy()
+        for a fully independent object.
         """
-        newobj = copy.deepcopy(self)  #This looks like None, but is it type (MetaPandasObject, just __union__ prints None
-        newobj._frame = dfnew
-        
-        # THESE ARE NEVER TRANSFERED AT DF LEVEL, JUST CREATED NEW.  TRY
-        # df.loc
-        # a = df*50
-        # a._loc  ---> Will be None
-        #newobj._loc = self._loc
-        #newobj._iloc = self._iloc
-        #newobj._ix = self._ix         
+        newobj = self.__class__.__new__(self.__class__)
+        attrs = newobj.__dict__
+        for attr, value in self.__dict__.iteritems():
+            if isinstance(value, (list, dict, set)):
+                value = copy.copy(value)
+            attrs[attr] = value
+
+        # Eg indexers hold a reference to self; created anew on newobj if used
+        for attr in self._untransferred:
+            attrs.pop(attr, None)
+
+        attrs['_frame'] = dfnew
         return newobj
 
 
@@ -288,6 +310,9 @@ class MetaPandasObject(object):
     _iloc=None
     _loc=None
 
+    # Attributes bound to an instance, like cached indexers (not transferred)
+    _untransferred = ('_ix', '_iloc', '_loc')
+
         
     @property	  	
     def ix(self, *args, **kwargs):      	
@@ -267,6 +267,11 @@ def corr_multi(corr2d, **pltkwargs):
     """ """
     
     sync = corr2d.sync #Used to look up some span attributes for now
+    async = corr2d.async
+
+    # Factored (low-rank) spectra are plotted from downsampled renderings
+    if corr2d.factored:
+        sync, async = sync.render(), async.render()
     
     # Boilerplate multiplot
 
@@ -304,7 +309,7 @@ def corr_multi(corr2d, **pltkwargs):
                            title='Sync. Correlation ($\Phi$)',
                             **pltkwargs)
 
-    ax4 = corr2d.async.plot(ax=ax4,
+    ax4 = async.plot(ax=ax4,
                             title='Async. Correlation ($\Psi$)',
                             **pltkwargs)
 
@@ -0,0 +1,149 @@
+""" Tests for skspec.correlation.corr module."""
+
+import os
+import unittest
+import numpy as np
+import pandas.util.testing as tm
+from numpy.testing import *
+from skspec.correlation import Corr2d, TiledCorr2d, StreamingCorr2d, \
+     corr2d_batch
+from skspec.core.specstack import SpecStack
+from skspec.data import aunps_glass
+
+
+ts = aunps_glass().iloc[0:50, 0:20]
+
+class TestCorr2d(tm.TestCase):
+    def test_cache(self):
+        cd = Corr2d(ts)
+        sync = cd.sync_noscale
+        self.assertTrue(cd.sync_noscale is sync)
+        cd.set_center(None)
+        self.assertFalse(cd.sync_noscale is sync)
+
+    def test_scaled_cache(self):
+        cd = Corr2d(ts)
+        cd.scale(alpha=0.5, beta=0.0)
+        sync1 = np.array(cd.sync)
+        cd.alpha = 1.0
+        sync2 = np.array(cd.sync)
+        expected = cd.sync_noscale * cd.joint_var**-1.0
+        assert_array_almost_equal(sync2, expected)
+        self.assertFalse(np.allclose(sync1, sync2))
+
+    def test_async_fft(self):
+        cd = Corr2d(ts)
+        cd_fft = Corr2d(ts, async_engine='fft')
+        assert_array_almost_equal(cd.async_noscale, cd_fft.async_noscale)
+        cd.async_engine = 'fft'
+        assert_array_almost_equal(cd.async_noscale, cd_fft.async_noscale)
+
+    def test_tiled(self):
+        cd = Corr2d(ts)
+        cd.scale()
+        tiled = TiledCorr2d(ts, tile_size=7)
+        tiled.scale()
+        assert_array_almost_equal(np.array(cd.sync), np.array(tiled.sync))
+        assert_array_almost_equal(np.array(cd.async), np.array(tiled.async))
+        assert_array_almost_equal(cd.coeff_corr, tiled.coeff_corr)
+        assert_array_almost_equal(np.array(cd.phase), np.array(tiled.phase))
+        nfiles = len(os.listdir(tiled.directory))
+        tiled.phase, tiled.modulous, tiled.modulous
+        self.assertEqual(len(os.listdir(tiled.directory)), nfiles + 1)
+        # Scaled sync, async, phase and modulous files are replaced
+        tiled.alpha = 0.5
+        self.assertEqual(len(os.listdir(tiled.directory)), nfiles - 3)
+        tiled.phase
+        self.assertEqual(len(os.listdir(tiled.directory)), nfiles)
+        tiled.cleanup()
+
+    def test_roi(self):
+        cd = Corr2d(ts)
+        cd.scale()
+        values = np.array(ts.index)
+        roi = cd.roi((values[5], values[15]), (values[30], values[40]))
+        self.assertEqual(roi.shape, (11, 11))
+        assert_array_almost_equal(np.array(roi.sync),
+                                  np.array(cd.sync)[5:16, 30:41])
+        assert_array_almost_equal(np.array(roi.async),
+                                  np.array(cd.async)[5:16, 30:41])
+        assert_array_almost_equal(roi.coeff_corr, cd.coeff_corr[5:16, 30:41])
+
+    def test_codist(self):
+        # Numeric perturbation (seconds), not timestamps
+        cd = Corr2d(ts.as_varunit('s'))
+        tbar = np.array(cd.char_perturb)
+        tm, t1 = cd.columns[-1], cd.columns[0]
+        async = np.array(cd.async_codist)
+        self.assertAlmostEqual(async[2, 7], 
+                               (tbar[7] - tbar[2]) / (tm - t1) * cd.joint_var[2, 7])
+        assert_array_almost_equal(np.array(cd.sync_codist)**2 + async**2,
+                                  cd.joint_var**2)
+
+    def test_char_index(self):
+        cd = Corr2d(ts)
+        data = np.array(ts)
+        m = data.shape[1]
+        expected = np.dot(data, np.arange(1, m+1)) / (m * data.mean(axis=1))
+        assert_array_almost_equal(np.array(cd.char_index), expected)
+
+    def test_moving_window(self):
+        cd = Corr2d(ts)
+        data = np.array(ts)
+        power, maps = cd.moving_window(5, step=2, maps=True)
+        self.assertEqual(power.shape, (data.shape[0], 8))
+        assert_array_almost_equal(np.array(power)[:, 3],
+                                  data[:, 6:11].var(axis=1, ddof=1))
+        assert_array_almost_equal(np.diag(np.array(maps[3])),
+                                  np.array(power)[:, 3])
+
+    def test_streaming(self):
+        cd = Corr2d(ts)
+        stream = StreamingCorr2d(ts.iloc[:, 0:5])
+        for i in range(5, ts.shape[1]):
+            stream.update(ts.iloc[:, i])
+        self.assertEqual(stream.shape, ts.shape)
+        assert_array_almost_equal(stream.sync_noscale, cd.sync_noscale)
+        assert_array_almost_equal(stream.coeff_corr, cd.coeff_corr)
+        assert_array_almost_equal(stream.async_noscale, cd.async_noscale)
+
+    def test_factored(self):
+        cd = Corr2d(ts)
+        cd.scale()
+        fcd = Corr2d(ts, factored=True)
+        fcd.scale()
+        sync, async = np.array(cd.sync), np.array(cd.async)
+        assert_array_almost_equal(np.array(fcd.sync.to_spec2d()), sync)
+        assert_array_almost_equal(np.array(fcd.async.to_spec2d()), async)
+        assert_array_almost_equal(np.array(fcd.sync.diagonal()), np.diag(sync))
+        values = np.array(ts.index)
+        assert_array_almost_equal(np.array(fcd.async.spectrum(values[7])),
+                                  async[7])
+        assert_array_almost_equal(np.array(fcd.correlation.block(
+                                  (values[5], values[15]))),
+                                  cd.coeff_corr[5:16, 5:16])
+        self.assertEqual(fcd.sync.render(points=10).shape, (10, 10))
+
+    def test_batch(self):
+        stack = SpecStack([('a', ts), ('b', ts.iloc[:, 0:10])])
+        syncs = corr2d_batch(stack, workers=2, pool='thread')
+        assert_array_almost_equal(np.array(syncs[1]), 
+                                  np.array(Corr2d(ts.iloc[:, 0:10]).sync))
+        syncs = corr2d_batch(stack, workers=2, pool='process')
+        assert_array_almost_equal(np.array(syncs[0]), np.array(Corr2d(ts).sync))
+        self.assertEqual(syncs[1].specunit, ts.specunit)
+        self.assertIs(syncs[1].spec, stack['b'])
+        out = corr2d_batch(stack, outputs=('sync', 'correlation'), workers=1)
+        assert_array_almost_equal(np.array(out[1][0]),
+                                  Corr2d(ts).coeff_corr)
+
+    def test_float32(self):
+        ts32 = aunps_glass(dtype='float32').iloc[0:50, 0:20]
+        cd, cd32 = Corr2d(ts), Corr2d(ts32)
+        for attr in ('sync_noscale', 'async_noscale'):
+            expected, out = getattr(cd, attr), getattr(cd32, attr)
+            self.assertEqual(out.dtype, np.float32)
+            assert_allclose(out, expected, rtol=1e-3,
+                            atol=1e-4 * np.abs(expected).max())
+        cd32.async_engine = 'fft'
+        self.assertEqual(cd32.async_noscale.dtype, np.float32)
@@ -4,6 +4,7 @@ amazing test suite, so thank you to the pandas team for such diligence.
 https://github.com/pydata/pandas/blob/master/pandas/tests/testindex.py
 """
 import sys
+import cPickle
 import operator
 import nose
 import unittest
@@ -39,6 +40,67 @@ class TestIndex(tm.TestCase):
         tindex2 = DatetimeIndex(['2014-05-22 15:38:23', '2014-05-22 15:38:26', ' 2014-05-22 15:38:30'])
         self.assertFalse(tindex1.identical(tindex2))
 
+    def test_pickle(self):
+        sindex = SpecIndex([430.1, 430.47, 430.85], unit='nm')
+        sindex.name = 'wavelength'
+        out = cPickle.loads(cPickle.dumps(sindex, cPickle.HIGHEST_PROTOCOL))
+        self.assertEqual(out.unit, 'nm')
+        self.assertEqual(out.name, 'wavelength')
+        self.assertTrue(out.equals(sindex))
+        tindex = TimeIndex(DatetimeIndex(['2014-05-22 15:38:23', '2014-05-22 15:38:26']))
+        out = cPickle.loads(cPickle.dumps(tindex.convert('s')))
+        self.assertEqual(out.unit, 's')
+        self.assertTrue(out.convert('dti').equals(tindex))
+
+    def test_dti_convert(self):
+        dti = DatetimeIndex(['2014-05-22 15:38:23', '2014-05-22 15:38:26', '2014-05-22 15:39:30'])
+        tindex = TimeIndex(dti)
+        assert_array_almost_equal(tindex.convert('s'), [0.0, 3.0, 67.0])
+        assert_array_almost_equal(tindex.convert('m'), [0.0, 0.05, 67.0 / 60.0])
+        self.assertTrue(tindex.convert('s').convert('dti').datetimeindex.equals(dti))
+        tindex.cumsum = False
+        assert_array_almost_equal(tindex.convert('ms'), [0.0, 3000.0, 64000.0])
+
+    def test_grid(self):
+        index = SpecIndex(np.linspace(400, 900, 1001), unit='nm')
+        self.assertEqual(index.grid, (400.0, 0.5, 1001))
+        start, step, n = index[10:500:3].grid
+        self.assertAlmostEqual(step, 1.5)
+        self.assertEqual(n, len(index[10:500:3]))
+        self.assertEqual(SpecIndex([1., 2., 4.]).grid, None)
+        values = np.array(index)
+        queries = [400.0, 512.3, 899.9]
+        assert_array_equal(index.grid_positions(queries),
+                           [np.abs(values - q).argmin() for q in queries])
+
+    def test_convert_cache(self):
+        index = SpecIndex(np.linspace(400, 900, 1001), unit='nm')
+        ev = index.convert('ev')
+        self.assertIsNot(index.convert('ev'), ev)
+        assert_array_equal(index.convert('ev'), ev)
+        assert_array_equal(ev.convert('nm'), index)
+        self.assertEqual(ev.convert('nm').unit, 'nm')
+        assert_array_almost_equal(ev, ev._unit.from_canonical(np.array(index) * 1e-9))
+        cm = index.convert('cm')
+        self.assertAlmostEqual(cm.grid[1], 0.5e-7)
+        assert_array_almost_equal(cm.convert('cm-1'), 1.0 / np.array(cm))
+
+    def test_convert_shared(self):
+        ts1 = aunps_glass().iloc[0:10, 0:5].as_varunit('s')
+        ts2 = ts1.deepcopy()
+        ts2.index, ts2.columns = ts1.index, ts1.columns
+        names = ts2.index.name, ts2.columns.name
+        dti = ts2.columns.datetimeindex
+        for spec in (ts1, ts2):
+            spec.specunit = 'ev'
+            spec.varunit = 'm'
+        ts1.index.name = 'energy'
+        ts1.columns.name = 'elapsed'
+        ts1.columns._stored_dti = dti[::-1]
+        self.assertEqual((ts2.index.name, ts2.columns.name), names)
+        self.assertTrue(ts2.columns.datetimeindex.equals(dti))
+        self.assertEqual(ts2.as_varunit('s').columns.name, names[1])
+
 
 
 class TestIndexing(tm.TestCase):        
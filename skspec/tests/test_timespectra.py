@@ -1,14 +1,20 @@
+import os
 import sys
+import shutil
+import tempfile
 import operator
 import nose
 import unittest
 import numpy as np
+from scipy import integrate
 import pandas.util.testing as tm
 from nose.tools import *
 from copy import deepcopy
 from numpy.testing import *
 from skspec import AnyFrame, Spectra, TimeSpectra, SpecStack
 from skspec.core.abcindex import ConversionIndex, CustomIndex, ConversionFloat64Index
+from skspec.core.abcspectra import SpecError
+from skspec.core.spectra import Spectrum
 from skspec.core.specindex import SpecIndex
 from skspec.core.timeindex import TimeIndex
 from skspec.data import aunps_glass
@@ -58,6 +64,15 @@ class test_timespectra(tm.TestCase):
             ts1[item] -= ts.baseline
             assert_array_almost_equal(ts[item],ts1[item])
         
+    def test_subbase_inplace(self):
+        ts1 = aunps_glass().iloc[:, 0:5]
+        ts1.baseline = np.random.randn(ts1.shape[0])
+        ts2 = ts1.deepcopy()
+        ts1.sub_base()
+        ts2.sub_base(inplace=True)
+        assert_array_almost_equal(ts2, ts1)
+        self.assertTrue(ts2._base_sub)
+
     def test_addbase(self):
         AMP = 100
         ts.baseline = AMP * np.random.randn(ts.shape[0])
@@ -71,4 +86,139 @@ class test_timespectra(tm.TestCase):
     def test_numeric(self):
         tsquared = ts**2
         for item in ts.columns:
-            assert_array_almost_equal(ts[item]**2,tsquared[item])        
\ No newline at end of file
+            assert_array_almost_equal(ts[item]**2,tsquared[item])        
+        
+    def test_transfer(self):
+        ts1 = aunps_glass()
+        ts1.baseline = np.random.randn(ts1.shape[0])
+        ts1.iloc[0:2]
+        ts2 = ts1 * 2.0
+        ts2.name = 'doubled'
+        self.assertNotEqual(ts1.name, ts2.name)
+        assert_array_almost_equal(ts2.iloc[0:2], ts1.iloc[0:2] * 2.0)
+        base = ts2.baseline
+        base[:] = 0.0
+        assert_array_almost_equal(ts2.baseline, ts1.baseline)
+        self.assertFalse(np.allclose(ts2.baseline, 0.0))
+
+    def test_conserved_slice(self):
+        ts1 = aunps_glass()
+        ts1.baseline = np.random.randn(ts1.shape[0])
+        base = np.array(ts1.baseline)
+        assert_array_almost_equal(ts1.iloc[10:20].baseline, base[10:20])
+        assert_array_almost_equal(ts1.iloc[:, 0:3].baseline, base)
+
+    def test_nearby(self):
+        ts1 = aunps_glass()
+        values = np.array(ts1.index)
+        queries = [values[3] + 0.01, 600.3, values[-1]]
+        expected = [np.abs(values - q).argmin() for q in queries]
+        assert_array_equal(ts1.nearby.nearest(queries), values[expected])
+        assert_array_almost_equal(ts1.nearby[queries], ts1.iloc[expected])
+        self.assertEqual(len(ts1.nearby[queries].reference), 3)
+        ts2 = ts1.as_specunit('ev')
+        values = np.array(ts2.index)
+        expected = [np.abs(values - q).argmin() for q in (2.0, 2.2)]
+        assert_array_equal(ts2.nearby.nearest([2.0, 2.2]), values[expected])
+
+    def test_from_frame(self):
+        ts1 = aunps_glass().iloc[0:20, 0:5]
+        ts1.reference = 0
+        ts2 = TimeSpectra._from_frame(ts1._frame.copy(), name='fast', norm=ts1.norm,
+                                      reference=np.array(ts1.reference))
+        self.assertEqual(ts2.name, 'fast')
+        self.assertEqual(ts2.specunit, ts1.specunit)
+        self.assertEqual(ts2.iunit, 'cts')
+        assert_array_almost_equal(ts2.as_norm('a'), ts1.as_norm('a'))
+        assert_array_almost_equal(TimeSpectra.from_series(ts1), ts1)
+        self.assertRaises(SpecError, TimeSpectra._from_frame, ts1._frame.T)
+
+    def test_bands(self):
+        ts1 = aunps_glass().iloc[:, 0:5]
+        values, x = np.array(ts1), np.array(ts1.index)
+        ranges = [(450.0, 500.0), (500.0, 650.0)]
+        rows = [(x >= start) & (x <= stop) for start, stop in ranges]
+        assert_array_almost_equal(ts1.wavelength_slices(ranges, apply_fcn='mean'),
+                                  [values[r].mean(axis=0) for r in rows])
+        assert_array_almost_equal(ts1.wavelength_slices(ranges, apply_fcn='trapz'),
+                                  [np.trapz(values[r], x[r], axis=0) for r in rows])
+        simps = ts1.wavelength_slices(ranges[1], apply_fcn='simps')
+        self.assertIsInstance(simps, Spectrum)
+        assert_array_almost_equal(simps, integrate.simps(values[rows[1]], x[rows[1]],
+                                                         axis=0, even='last'))
+        area = ts1.area()
+        self.assertIsInstance(area, Spectrum)
+        self.assertEqual(area.specifier, 'Area (simps)')
+        assert_array_almost_equal(area, integrate.simps(values, x, axis=0,
+                                                        even='last'))
+
+    def test_norm(self):
+        ts1 = aunps_glass().iloc[0:20, 0:5]
+        ts1.reference = 0
+        data, ref = np.array(ts1), np.array(ts1.reference)
+        absorb = ts1.as_norm('a')
+        assert_array_almost_equal(absorb, -np.log10(data / ref[:, None]))
+        assert_array_almost_equal(absorb.as_norm('t'), ref[:, None] / data)
+        assert_array_almost_equal(absorb.as_norm(None), data)
+        ts1.as_norm('a', inplace=True)
+        assert_array_almost_equal(ts1, absorb)
+
+    def test_norm_cache(self):
+        ts1 = aunps_glass().iloc[0:20, 0:5]
+        ts1.reference = 0
+        ts1.cache_norms()
+        absorb = ts1.as_norm('a')
+        assert_array_almost_equal(ts1.as_norm('a'), absorb)
+        self.assertEqual(len(ts1._normcache), 1)
+        ts1.reference = 1
+        self.assertEqual(len(ts1._normcache), 0)
+        ts1.cache_norms(max_bytes=np.array(ts1).nbytes)
+        ts1.as_norm('a')
+        ts1.as_norm('t')
+        self.assertEqual(len(ts1._normcache), 1)
+
+    def test_dtype(self):
+        ts1 = aunps_glass(dtype='float32').iloc[:, 0:5]
+        self.assertEqual(ts1.dtype, np.float32)
+        self.assertEqual(np.array(ts1).dtype, np.float32)
+        self.assertEqual(ts1.reference.dtype, np.float32)
+        absorb = ts1.as_norm('a')
+        self.assertEqual(np.array(absorb).dtype, np.float32)
+        self.assertEqual(absorb.reference.dtype, np.float32)
+        self.assertEqual(np.array(ts1.area()).dtype, np.float32)
+        copy = TimeSpectra.from_series(ts1)
+        self.assertEqual(np.array(copy).dtype, np.float32)
+        self.assertEqual(copy._dtype, np.float32)
+        expected = aunps_glass().iloc[:, 0:5].as_norm('a')
+        assert_array_almost_equal(absorb, expected, decimal=4)
+
+    def test_lazy(self):
+        ts1 = aunps_glass().iloc[:, 0:5]
+        ts1.reference = 0
+        ts1.baseline = 0.5 * np.array(ts1).min(axis=1)
+        values = np.array(ts1)
+        lazy = ts1.lazy().sub_base().as_norm('a').nearby[500:600]
+        eager = ts1.deepcopy()
+        eager.sub_base()
+        eager = eager.as_norm('a').nearby[500:600]
+        assert_array_almost_equal(lazy.compute(), eager)
+        assert_array_almost_equal(lazy.area().compute(), eager.area())
+        assert_array_almost_equal(np.array(ts1), values)
+
+    def test_mmap(self):
+        ts1 = aunps_glass().iloc[:, 0:10]
+        ts1.reference = 0
+        directory = tempfile.mkdtemp()
+        try:
+            mts = ts1.to_mmap(os.path.join(directory, 'data'), chunksize=3)
+            self.assertEqual(mts.shape, ts1.shape)
+            assert_array_almost_equal(mts.iloc[5:20, 2:8], ts1.iloc[5:20, 2:8])
+            assert_array_almost_equal(mts.nearby[500:600], ts1.nearby[500:600])
+            assert_array_almost_equal(mts.nearby[[450.3, 600.1]],
+                                      ts1.nearby[[450.3, 600.1]])
+            assert_array_almost_equal(mts.area(), ts1.area())
+            absorb = mts.as_norm('a', os.path.join(directory, 'absorb'))
+            self.assertEqual(absorb.norm, 'a')
+            assert_array_almost_equal(absorb.to_spectra(), ts1.as_norm('a'))
+        finally:
+            shutil.rmtree(directory)
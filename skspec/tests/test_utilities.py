@@ -0,0 +1,21 @@
+import numpy as np
+import pandas.util.testing as tm
+from numpy.testing import *
+from pandas import DataFrame, date_range
+from skspec.core.utilities import boxcar, rebin
+
+
+class TestUtilities(tm.TestCase):
+    def test_binning(self):
+        values = np.arange(40.).reshape(10, 4)
+        df = DataFrame(values, index=np.arange(10.))
+        assert_array_almost_equal(rebin(df, 5, avg_fcn='mean'),
+                                  [values[0:5].mean(axis=0), values[5:10].mean(axis=0)])
+        box = boxcar(df, 5)
+        assert_array_almost_equal(box.index, [0.0, 4.5, 9.0])
+        assert_array_almost_equal(box, [values[0:5].mean(axis=0), values[5:9].mean(axis=0),
+                                        values[9]])
+        times = DataFrame(values[0:2], columns=date_range('2014-05-22 15:38', periods=4, freq='1min'))
+        binned = rebin(times, '2min', axis=1, avg_fcn='sum')
+        assert_array_almost_equal(binned, [[1.0, 5.0], [9.0, 13.0]])
+        self.assertTrue(binned.columns.equals(date_range('2014-05-22 15:38', periods=2, freq='2min')))
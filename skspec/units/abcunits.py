@@ -47,6 +47,10 @@ class ConversionUnit(Unit):
    """
    _canonical = False
 
+   # to_canonical() as ('linear', a): a * x, or ('reciprocal', a): a / x, for
+   # units where it's one of these.  Lets conversions compose (see compose())
+   _canonical_form = None
+
    @staticmethod   
    def to_canonical(self):
       NotImplemented
@@ -54,6 +58,26 @@ class ConversionUnit(Unit):
    @staticmethod
    def from_canonical(self):
       NotImplemented
+
+
+def compose(inunit, outunit):
+   """ Conversion of inunit to outunit as a single transform, skipping the
+   canonical unit: ('linear', k) for k * x or ('reciprocal', k) for k / x.
+   None if either unit has no _canonical_form."""
+   inform = getattr(inunit, '_canonical_form', None)
+   outform = getattr(outunit, '_canonical_form', None)
+   if inform is None or outform is None:
+      return None
+
+   (inkind, a_in), (outkind, a_out) = inform, outform
+   if inkind == 'linear':
+      if outkind == 'linear':
+         return ('linear', a_in / a_out)
+      return ('reciprocal', a_out / a_in)
+   if outkind == 'linear':
+      return ('reciprocal', a_in / a_out)
+   return ('linear', a_out / a_in)
+
       
 if __name__ == '__main__':
    unit = Unit(short='bar')
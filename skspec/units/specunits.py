@@ -49,6 +49,7 @@ class Meters(SpecUnit):
    short = 'm'
    full = 'meters'
    category = 'wavelength'
+   _canonical_form = ('linear', 1.0)
    _canonical = True
    
    @staticmethod
@@ -64,6 +65,7 @@ class Centimeters(SpecUnit):
    short = 'cm'
    full = 'centimeters'
    category = 'wavelength'
+   _canonical_form = ('linear', 1.0 / 100.0)
 
    @staticmethod   
    def to_canonical(x):
@@ -78,6 +80,7 @@ class Micrometers(SpecUnit):
    short = 'um'
    full = 'microns'
    category = 'wavelength'
+   _canonical_form = ('linear', 1.0 / 100000.0)
    
    @staticmethod
    def to_canonical(x):
@@ -92,6 +95,7 @@ class Nanometers(SpecUnit):
    short = 'nm'
    full = 'nanometers'
    category = 'wavelength'
+   _canonical_form = ('linear', 1.0 / 1000000000.0)
    
    @staticmethod
    def to_canonical(x):
@@ -107,6 +111,7 @@ class Metersinverse(SpecUnit):
    short = 'k'
    full = 'inverse meters' #or cycles per meter or radians per meter
    category = 'wavenumber'
+   _canonical_form = ('reciprocal', 1.0)
    
    # TEST THIS
    @staticmethod
@@ -122,6 +127,7 @@ class Centimetersinverse(SpecUnit):
    short = 'cm-1'
    full = 'inverse centimeters'
    category = 'wavenumber'
+   _canonical_form = ('reciprocal', 0.01)
 
    # DEFINE IN TERMS OF TO METERS?
    @staticmethod
@@ -151,6 +157,7 @@ class Frequency(SpecUnit):
    short = 'f'
    full = 'hertz'
    category = 'frequency'
+   _canonical_form = ('reciprocal', C)
    
    @staticmethod
    def to_canonical(x):
@@ -168,6 +175,7 @@ class Angularfrequency(SpecUnit):
    short = 'w'
    full = 'radians per second'
    category = 'frequency'
+   _canonical_form = ('reciprocal', 2.0 * pi * C)
    
    @staticmethod
    def to_canonical(x):
@@ -183,6 +191,7 @@ class Electronvolts(SpecUnit):
    short = 'ev'
    full = 'electron volts'
    category = 'energy'
+   _canonical_form = ('reciprocal', H*C/(eVtoJ))
 
    @staticmethod
    def to_canonical(x):